@@ -35,6 +35,7 @@ from .manager import (
     stop_speech,
 )
 from .playback import AudioPlayer, get_player
+from .streamer import TTSStreamer, StreamingPlayer, StreamChunk
 
 __all__ = [
     # Base
@@ -50,6 +51,10 @@ __all__ = [
     # Playback
     "AudioPlayer",
     "get_player",
+    # Streaming
+    "TTSStreamer",
+    "StreamingPlayer",
+    "StreamChunk",
 ]
 
 __version__ = "2.0"
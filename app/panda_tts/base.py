@@ -6,6 +6,7 @@ Abstract base class for all TTS engines.
 Version: 2.0
 """
 
+import re
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -13,6 +14,45 @@ from typing import Optional, Dict, Any, Literal
 
 logger = logging.getLogger(__name__)
 
+# Hangul syllables (AC00-D7AF), Jamo (1100-11FF), Compatibility Jamo (3130-318F)
+_KOREAN_RE = re.compile("[\\uAC00-\\uD7AF\\u1100-\\u11FF\\u3130-\\u318F]")
+
+# Any alphabetic character (letters only, no digits/underscore)
+_ALPHA_RE = re.compile(r"[^\W\d_]")
+
+# Above this length, counting via numpy lookup tables beats regex findall
+# (which builds a Python list of match strings). Short chat utterances stay
+# on the allocation-free regex path.
+_TABLE_MIN_CHARS = 512
+
+# Built lazily on the first long input; 64KB each, indexed by UTF-16 code
+# unit. Hangul table mirrors _KOREAN_RE; alpha table mirrors _ALPHA_RE for
+# the BMP (astral-plane letters encode as surrogate pairs and count as 0,
+# a negligible skew at these text lengths).
+_HANGUL_TABLE = None
+_ALPHA_TABLE = None
+
+
+def _ensure_tables() -> bool:
+    """Build the code-unit lookup tables if numpy is available."""
+    global _HANGUL_TABLE, _ALPHA_TABLE
+    if _HANGUL_TABLE is not None:
+        return True
+    try:
+        import numpy as np
+    except ImportError:
+        return False
+    hangul = np.zeros(0x10000, dtype=np.uint8)
+    hangul[0xAC00:0xD7B0] = 1  # Hangul syllables
+    hangul[0x1100:0x1200] = 1  # Jamo
+    hangul[0x3130:0x3190] = 1  # Compatibility Jamo
+    alpha = np.frombuffer(
+        bytes(chr(cp).isalpha() for cp in range(0x10000)), dtype=np.uint8
+    )
+    _ALPHA_TABLE = alpha
+    _HANGUL_TABLE = hangul
+    return True
+
 
 class TTSEngine(ABC):
     """
@@ -125,30 +165,32 @@ def detect_language(text: str) -> Literal["ko", "en"]:
     """
     if not text:
         return "en"
-    
-    korean_count = 0
-    total_alpha = 0
-    
-    for char in text:
-        code = ord(char)
-        # Hangul syllables (AC00-D7AF)
-        if 0xAC00 <= code <= 0xD7AF:
-            korean_count += 1
-            total_alpha += 1
-        # Hangul Jamo (1100-11FF)
-        elif 0x1100 <= code <= 0x11FF:
-            korean_count += 1
-            total_alpha += 1
-        # Hangul Compatibility Jamo (3130-318F)
-        elif 0x3130 <= code <= 0x318F:
-            korean_count += 1
-            total_alpha += 1
-        elif char.isalpha():
-            total_alpha += 1
-    
+
+    # Pure-ASCII check first: CPython stores an ascii flag on str, so
+    # this is O(1) and settles most English chat inputs outright
+    if text.isascii():
+        return "en"
+
+    # Fast path: no Hangul at all - a single C-level regex scan settles
+    # the remaining non-Korean case without per-character Python work
+    if not _KOREAN_RE.search(text):
+        return "en"
+
+    if len(text) >= _TABLE_MIN_CHARS and _ensure_tables():
+        # Fancy-index + sum over UTF-16 code units runs at memory
+        # bandwidth, well ahead of regex findall on long documents
+        import numpy as np
+
+        u16 = np.frombuffer(text.encode("utf-16-le"), dtype=np.uint16)
+        korean_count = int(_HANGUL_TABLE[u16].sum())
+        total_alpha = int(_ALPHA_TABLE[u16].sum())
+    else:
+        korean_count = len(_KOREAN_RE.findall(text))
+        total_alpha = len(_ALPHA_RE.findall(text))
+
     if total_alpha == 0:
         return "en"
-    
+
     # If more than 30% Korean characters, treat as Korean
     korean_ratio = korean_count / total_alpha
     return "ko" if korean_ratio > 0.3 else "en"
@@ -15,13 +15,18 @@ Features:
 """
 
 import os
+import queue
+import struct
 import inspect
 import logging
 import time
 import threading
+import contextlib
 from pathlib import Path
 from typing import Optional, Dict, Any, Literal
 
+import numpy as np
+
 from .base import TTSEngine, chunk_text
 from .playback import get_player
 
@@ -37,6 +42,22 @@ KOKORO_VOICES = {
 # Kokoro: ~1000 chars = ~1 minute, so 1500 chars ≈ 90 seconds
 MAX_CHUNK_CHARS = 1500
 
+# Per-input cap for synthesize_batch: KPipeline re-splits any single
+# input that exceeds its internal token limit (~510 phonemes), which
+# would break the one-chunk-per-input mapping the batch relies on.
+# Comfortably below that limit for English text.
+_BATCH_MAX_INPUT_CHARS = 400
+
+# Canonical 44-byte WAV header for streaming output (PCM_16, 24kHz,
+# mono) with the size fields pinned to 0xFFFFFFFF ("unknown length"),
+# built once so per-chunk streaming never touches the wave module
+_STREAM_WAV_HEADER = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0xFFFFFFFF, b'WAVE',
+    b'fmt ', 16, 1, 1, 24000, 48000, 2, 16,
+    b'data', 0xFFFFFFFF,
+)
+
 
 class KokoroEngine(TTSEngine):
     """
@@ -54,6 +75,7 @@ class KokoroEngine(TTSEngine):
         speed: float = 1.0,
         output_dir: Optional[Path] = None,
         device: str = "cpu",
+        dtype: str = "q8",
     ):
         """
         Initialize Kokoro engine.
@@ -63,17 +85,29 @@ class KokoroEngine(TTSEngine):
             speed: Speech speed multiplier (0.5-2.0)
             output_dir: Audio output directory
             device: Device for inference (cpu recommended to save GPU for LLM)
+            dtype: Weight precision (q8, fp16, fp32, auto)
         """
         super().__init__()
 
         self._voice = "am_michael" if voice == "michael" else voice
         self._speed = max(0.5, min(2.0, speed))
         self._device = device
+        self._dtype = dtype
         self._output_dir = output_dir or Path.home() / ".panda1" / "audio_out"
+        self._cache_dir = Path.home() / ".panda1" / "model_cache"
 
         # Pipeline reference
         self._pipeline = None
 
+        # Reusable CUDA memory pool (created in warmup on CUDA only);
+        # keeps the autoregressive decoder off cudaMalloc/cudaFree
+        self._mem_pool = None
+
+        # Grow-only int16 scratch for PCM conversion; streaming emits
+        # ~10 chunks/s and each fresh allocation is O(chunk) heap churn
+        self._scratch_i16 = None
+        self._scratch_lock = threading.Lock()
+
         # Threading for non-blocking playback
         self._speak_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
@@ -98,18 +132,108 @@ class KokoroEngine(TTSEngine):
             # 'a' = American English
             self._pipeline = self._create_pipeline(lang_code='a')
 
-            # Verify voice is available by doing a quick test synthesis
-            logger.info(f"Testing voice: {self._voice}")
-            test_gen = self._pipeline("test", voice=self._voice, speed=self._speed)
-            for _, _, audio in test_gen:
-                if audio is not None and len(audio) > 0:
-                    self._is_warmed_up = True
-                    logger.info("Kokoro warmup complete")
-                    return True
-                break
+            # Downcast weights before the test synthesis warms the caches
+            self._apply_dtype()
+
+            # Memoize the G2P front-end: chat speech repeats short
+            # fragments ("Okay.", "Sure!") constantly and the CPU-bound
+            # phonemizer re-ran on every one of them
+            self._cache_g2p()
+
+            # Compile the model on CUDA: the decoder is many small ops
+            # where Python dispatch dominates; reduce-overhead replays
+            # them via CUDA graphs. dynamic=True since sentence lengths
+            # vary. torch.compile defers most errors to the first
+            # forward, so keep the eager module around and only commit
+            # to the compiled one after a successful test synthesis.
+            eager_model = None
+            if self._device == "cuda":
+                try:
+                    import torch
+                    model = getattr(self._pipeline, "model", None)
+                    if model is not None and hasattr(torch, "compile"):
+                        self._pipeline.model = torch.compile(
+                            model,
+                            mode="reduce-overhead",
+                            fullgraph=False,
+                            dynamic=True,
+                        )
+                        eager_model = model
+                        logger.info("Kokoro model compiled (reduce-overhead)")
+                except Exception as e:
+                    logger.debug(f"torch.compile skipped: {e}")
+
+            # One pool for all synthesis allocations on CUDA: the
+            # decoder's many small tensors otherwise hit synchronous
+            # cudaMalloc/cudaFree on every forward pass
+            if self._device == "cuda" and self._mem_pool is None:
+                try:
+                    import torch
+                    self._mem_pool = torch.cuda.MemoryPool()
+                except Exception as e:
+                    logger.debug(f"CUDA memory pool unavailable: {e}")
+
+            # Inference-only process: no autograd anywhere, and on CUDA
+            # let cudnn autotune the fixed-shape convolutions
+            try:
+                import torch
+                torch.set_grad_enabled(False)
+                if self._device == "cuda":
+                    torch.backends.cudnn.benchmark = True
+                    torch.set_float32_matmul_precision("high")
+            except ImportError:
+                pass
 
-            logger.error("Kokoro warmup failed - no audio generated")
-            return False
+            # Verify voice is available by doing a quick test synthesis.
+            # If the compiled model blows up on its first forward, revert
+            # to the eager module and retry - losing the optimization,
+            # not the engine.
+            logger.info(f"Testing voice: {self._voice}")
+            try:
+                got_audio = self._test_synthesis()
+            except Exception as e:
+                if eager_model is None:
+                    raise
+                logger.warning(
+                    f"Compiled model failed on first forward ({e}); "
+                    "reverting to eager"
+                )
+                self._pipeline.model = eager_model
+                eager_model = None
+                got_audio = self._test_synthesis()
+
+            if not got_audio:
+                logger.error("Kokoro warmup failed - no audio generated")
+                return False
+
+            # On CUDA, a couple of longer dummy passes now trigger cudnn
+            # autotune and torch.compile for representative sentence
+            # shapes, instead of stalling the first real utterance
+            if self._device == "cuda":
+                try:
+                    with self._inference_ctx():
+                        for n in (8, 32):
+                            for _ in self._pipeline(
+                                "a " * n, voice=self._voice, speed=self._speed
+                            ):
+                                pass
+                except Exception as e:
+                    if eager_model is not None:
+                        # Longer shapes can still trip the compiled
+                        # model; drop back to eager rather than leaving
+                        # a module that fails on real sentences
+                        logger.warning(
+                            f"Compiled model failed during shape warmup "
+                            f"({e}); reverting to eager"
+                        )
+                        self._pipeline.model = eager_model
+                        eager_model = None
+                    else:
+                        logger.debug(f"Shape warmup skipped: {e}")
+
+            self._is_warmed_up = True
+            logger.info("Kokoro warmup complete")
+            return True
 
         except RuntimeError as e:
             if self._should_retry_on_cpu(e):
@@ -126,6 +250,15 @@ class KokoroEngine(TTSEngine):
             self._is_warmed_up = False
             return False
 
+    def _test_synthesis(self) -> bool:
+        """Run one short forward pass; True if it produced audio."""
+        with self._inference_ctx():
+            for _, _, audio in self._pipeline(
+                "test", voice=self._voice, speed=self._speed
+            ):
+                return audio is not None and len(audio) > 0
+        return False
+
     def synthesize(
         self,
         text: str,
@@ -158,30 +291,30 @@ class KokoroEngine(TTSEngine):
 
             # Collect all audio chunks
             audio_chunks = []
-            generator = self._pipeline(text, voice=voice, speed=self._speed)
+            with self._inference_ctx():
+                generator = self._pipeline(text, voice=voice, speed=self._speed)
 
-            for graphemes, phonemes, audio in generator:
-                if audio is not None:
-                    audio_chunks.append(audio)
+                for graphemes, phonemes, audio in generator:
+                    if audio is not None:
+                        audio_chunks.append(audio)
 
             if not audio_chunks:
                 logger.error("No audio generated")
                 return None
 
-            # Concatenate audio chunks
-            import numpy as np
-            full_audio = np.concatenate(audio_chunks) if len(audio_chunks) > 1 else audio_chunks[0]
+            # Concatenate audio chunks into one preallocated buffer
+            # (concatenate re-walks the list to size the output first)
+            if len(audio_chunks) == 1:
+                full_audio = audio_chunks[0]
+            else:
+                total = sum(len(c) for c in audio_chunks)
+                full_audio = np.empty(total, dtype=np.float32)
+                pos = 0
+                for c in audio_chunks:
+                    full_audio[pos:pos + len(c)] = c
+                    pos += len(c)
 
-            # Save as WAV (24kHz sample rate)
-            try:
-                import soundfile as sf
-                sf.write(str(output_path), full_audio, 24000, subtype='PCM_16')
-            except ImportError:
-                # Fallback to scipy
-                from scipy.io import wavfile
-                # Normalize to int16
-                audio_int16 = (full_audio * 32767).astype(np.int16)
-                wavfile.write(str(output_path), 24000, audio_int16)
+            self._save_wav(full_audio, output_path)
 
             logger.debug(f"Audio saved: {output_path}")
             return output_path
@@ -196,6 +329,381 @@ class KokoroEngine(TTSEngine):
             logger.error(f"Kokoro synthesis failed: {e}")
             return None
 
+    def synthesize_array(
+        self,
+        text: str,
+        lang: Literal["en", "ko"] = "en",
+    ) -> Optional[tuple]:
+        """
+        Synthesize straight to a float32 array, skipping the WAV file.
+
+        For in-process playback (e.g. the replay cache) that would
+        otherwise write a file only to reopen and decode it.
+
+        Returns:
+            (float32 mono array, sample_rate) or None on failure
+        """
+        if not text.strip():
+            return None
+
+        if not self._is_warmed_up or self._pipeline is None:
+            if not self.warmup():
+                return None
+
+        voice = KOKORO_VOICES.get(lang, self._voice)
+        chunks = []
+        try:
+            with self._inference_ctx():
+                generator = self._pipeline(text, voice=voice, speed=self._speed)
+                for graphemes, phonemes, audio in generator:
+                    if audio is not None and len(audio) > 0:
+                        chunks.append(audio)
+        except Exception as e:
+            logger.error(f"Kokoro array synthesis failed: {e}")
+            return None
+
+        if not chunks:
+            return None
+
+        arrays = [
+            np.asarray(c.cpu() if getattr(c, "is_cuda", False) else c,
+                       dtype=np.float32)
+            for c in chunks
+        ]
+        full = np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+        return full, 24000
+
+    @staticmethod
+    def _save_wav(audio, output_path: Path) -> None:
+        """Save a float audio array as PCM_16 WAV (24kHz)."""
+        try:
+            import soundfile as sf
+            sf.write(str(output_path), audio, 24000, subtype='PCM_16')
+        except ImportError:
+            # Fallback to scipy
+            from scipy.io import wavfile
+            # Normalize to int16
+            audio_int16 = (audio * 32767).astype(np.int16)
+            wavfile.write(str(output_path), 24000, audio_int16)
+
+    def synthesize_batch(
+        self,
+        texts: list,
+        lang: Literal["en", "ko"] = "en",
+    ) -> list:
+        """
+        Synthesize several texts in a single pipeline invocation.
+
+        The inputs are joined with newlines and passed with
+        split_pattern=r'\\n+', so KPipeline treats each input as one
+        chunk and the i-th generated chunk maps back to the i-th text.
+        One invocation amortizes the per-call voice/G2P setup that
+        calling synthesize() in a loop repeats. That mapping only holds
+        while every input stays under KPipeline's internal token limit,
+        so over-long inputs and any chunk-count mismatch drop back to
+        per-text synthesize() calls - slower, but never assigning texts
+        each other's audio and never discarding valid inputs.
+
+        Args:
+            texts: Texts to synthesize, in order
+            lang: Language code for the whole batch
+
+        Returns:
+            List of output Paths aligned with texts (None on failure)
+        """
+        results: list = [None] * len(texts)
+        live = [i for i, t in enumerate(texts) if t and t.strip()]
+        if not live:
+            return results
+
+        if not self._is_warmed_up or self._pipeline is None:
+            if not self.warmup():
+                return results
+
+        if any(len(texts[i]) > _BATCH_MAX_INPUT_CHARS for i in live):
+            logger.info(
+                f"Batch input exceeds {_BATCH_MAX_INPUT_CHARS} chars; "
+                "synthesizing sequentially"
+            )
+            return self._synthesize_sequential(texts, lang, results, live)
+
+        voice = KOKORO_VOICES.get(lang, self._voice)
+        joined = "\n".join(texts[i].replace("\n", " ").strip() for i in live)
+        timestamp = int(time.time() * 1000)
+
+        try:
+            with self._inference_ctx():
+                generator = self._pipeline(
+                    joined, voice=voice, speed=self._speed, split_pattern=r'\n+'
+                )
+                audios = [audio for graphemes, phonemes, audio in generator]
+        except Exception as e:
+            logger.error(f"Kokoro batch synthesis failed: {e}")
+            return results
+
+        # One chunk per input is the whole basis of the positional
+        # mapping; if KPipeline re-split an input anyway, every later
+        # chunk is shifted and nothing can be trusted
+        if len(audios) != len(live):
+            logger.warning(
+                f"Kokoro batch chunk mismatch: {len(audios)} chunks for "
+                f"{len(live)} inputs; synthesizing sequentially"
+            )
+            return self._synthesize_sequential(texts, lang, results, live)
+
+        for pos, audio in enumerate(audios):
+            if audio is None or len(audio) == 0:
+                continue
+            output_path = self._output_dir / f"kokoro_{timestamp}_{pos}.wav"
+            self._save_wav(audio, output_path)
+            results[live[pos]] = output_path
+
+        return results
+
+    def _synthesize_sequential(
+        self,
+        texts: list,
+        lang: Literal["en", "ko"],
+        results: list,
+        live: list,
+    ) -> list:
+        """Per-text synthesize() fallback when fused batching is unsafe."""
+        for i in live:
+            results[i] = self.synthesize(texts[i], lang)
+        return results
+
+    def synthesize_chunks(
+        self,
+        text: str,
+        lang: Literal["en", "ko"] = "en",
+    ):
+        """
+        Yield WAV-encoded audio for each Kokoro sub-chunk as it is produced.
+
+        Unlike synthesize(), audio is yielded incrementally so playback can
+        start while later chunks are still being generated.
+
+        Args:
+            text: Text to synthesize
+            lang: Language code ("en" or "ko")
+
+        Yields:
+            WAV bytes (PCM_16, 24kHz, mono) per generated chunk
+        """
+        if not text.strip():
+            return
+
+        if not self._is_warmed_up or self._pipeline is None:
+            if not self.warmup():
+                return
+
+        voice = KOKORO_VOICES.get(lang, self._voice)
+        logger.debug(f"Streaming synthesis ({lang}): {text[:50]}...")
+
+        try:
+            with self._inference_ctx():
+                generator = self._pipeline(text, voice=voice, speed=self._speed)
+                for graphemes, phonemes, audio in generator:
+                    if audio is not None and len(audio) > 0:
+                        yield self._to_wav_bytes(audio)
+        except Exception as e:
+            logger.error(f"Kokoro streaming synthesis failed: {e}")
+
+    def synthesize_chunks_pcm(
+        self,
+        text: str,
+        lang: Literal["en", "ko"] = "en",
+    ):
+        """
+        Yield (int16 array, sample_rate) per generated chunk.
+
+        Same incremental generation as synthesize_chunks(), minus the
+        WAV container: consumers that hand PCM straight to the audio
+        device skip the per-chunk encode and re-parse entirely.
+
+        Args:
+            text: Text to synthesize
+            lang: Language code ("en" or "ko")
+
+        Yields:
+            (numpy int16 array, 24000) tuples per generated chunk
+        """
+        if not text.strip():
+            return
+
+        if not self._is_warmed_up or self._pipeline is None:
+            if not self.warmup():
+                return
+
+        voice = KOKORO_VOICES.get(lang, self._voice)
+        logger.debug(f"PCM streaming synthesis ({lang}): {text[:50]}...")
+
+        try:
+            with self._inference_ctx():
+                generator = self._pipeline(text, voice=voice, speed=self._speed)
+                for graphemes, phonemes, audio in generator:
+                    if audio is not None and len(audio) > 0:
+                        yield self._pcm_array(audio), 24000
+        except Exception as e:
+            logger.error(f"Kokoro streaming synthesis failed: {e}")
+
+    def synthesize_streaming(
+        self,
+        text: str,
+        lang: Literal["en", "ko"] = "en",
+    ):
+        """
+        Yield one streaming WAV header, then raw PCM frames per chunk.
+
+        Unlike synthesize_chunks() (which wraps every chunk in its own
+        WAV container), this amortizes header writing to a single
+        precomputed 44-byte prefix; the per-chunk work is just the
+        float32 to int16 conversion.
+
+        Yields:
+            The 44-byte streaming header first, then raw PCM_16 bytes
+            (24kHz, mono) per generated chunk
+        """
+        if not text.strip():
+            return
+
+        if not self._is_warmed_up or self._pipeline is None:
+            if not self.warmup():
+                return
+
+        voice = KOKORO_VOICES.get(lang, self._voice)
+        logger.debug(f"Raw streaming synthesis ({lang}): {text[:50]}...")
+
+        yield _STREAM_WAV_HEADER
+
+        # Synthesize in a producer thread behind a bounded queue:
+        # while the caller plays (or ships) chunk N, the pipeline is
+        # already phonemizing and decoding chunk N+1 instead of idling.
+        # maxsize bounds how far synthesis runs ahead of playback.
+        pcm_queue: queue.Queue = queue.Queue(maxsize=4)
+        abandoned = threading.Event()
+
+        def _put(item) -> bool:
+            """Put with periodic abandonment checks; False if given up."""
+            while not abandoned.is_set():
+                try:
+                    pcm_queue.put(item, timeout=0.2)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _producer() -> None:
+            try:
+                with self._inference_ctx():
+                    generator = self._pipeline(text, voice=voice, speed=self._speed)
+                    for graphemes, phonemes, audio in generator:
+                        if abandoned.is_set():
+                            return
+                        if audio is not None and len(audio) > 0:
+                            if not _put(self._pcm_bytes(audio)):
+                                return
+            except Exception as e:
+                logger.error(f"Kokoro streaming synthesis failed: {e}")
+            finally:
+                _put(None)
+
+        worker = threading.Thread(target=_producer, daemon=True)
+        worker.start()
+
+        try:
+            while True:
+                pcm = pcm_queue.get()
+                if pcm is None:
+                    break
+                yield pcm
+        finally:
+            # Consumer may close the generator early (stop request);
+            # let the producer bail instead of blocking on a full queue
+            abandoned.set()
+
+    def _pcm_array(self, audio):
+        """
+        Convert a float audio array to a fresh int16 numpy array.
+
+        Unlike _pcm_bytes this never hands out the shared scratch: the
+        result is queued behind the caller, so it must own its memory.
+        """
+        if getattr(audio, "is_cuda", False):
+            import torch
+            return (
+                audio.clamp_(-1.0, 1.0)
+                .mul_(32767.0)
+                .to(torch.int16)
+                .cpu()
+                .numpy()
+            )
+
+        audio = np.asarray(audio, dtype=np.float32)
+        np.clip(audio, -1.0, 1.0, out=audio)
+        audio *= np.float32(32767.0)
+        return audio.astype(np.int16)
+
+    def _pcm_bytes(self, audio) -> bytes:
+        """Convert a float audio array to raw PCM_16 bytes (no header)."""
+        # CUDA tensors: clamp and cast on-device so the host copy moves
+        # 2 bytes/sample of int16 across PCIe instead of 4 of float32
+        if getattr(audio, "is_cuda", False):
+            import torch
+            return (
+                audio.clamp_(-1.0, 1.0)
+                .mul_(32767.0)
+                .to(torch.int16)
+                .cpu()
+                .numpy()
+                .tobytes()
+            )
+
+        audio = np.asarray(audio, dtype=np.float32)
+        # Pipeline chunks are throwaway, so clamp and scale in place
+        np.clip(audio, -1.0, 1.0, out=audio)
+        audio *= np.float32(32767.0)
+
+        # Cast into the reusable scratch instead of a fresh int16 array
+        with self._scratch_lock:
+            need = audio.shape[0]
+            if self._scratch_i16 is None or self._scratch_i16.size < need:
+                grown = int(
+                    (self._scratch_i16.size if self._scratch_i16 is not None else 0)
+                    * 1.5
+                )
+                self._scratch_i16 = np.empty(max(need, grown), dtype=np.int16)
+            out = self._scratch_i16[:need]
+            out[:] = audio  # C-level truncating cast, same as astype
+            return out.tobytes()
+
+    def _to_wav_bytes(self, audio) -> bytes:
+        """Encode a float audio array as PCM_16 WAV bytes (24kHz, mono)."""
+        import io
+
+        # In-place clamp/scale/cast via _pcm_bytes - one memory pass
+        # instead of the separate clip, multiply, and astype temporaries
+        pcm = self._pcm_bytes(audio)
+
+        buffer = io.BytesIO()
+        try:
+            # libsndfile writes header and frames in one C call,
+            # vs the wave module's per-field struct.pack
+            import soundfile as sf
+            sf.write(
+                buffer, np.frombuffer(pcm, dtype=np.int16), 24000,
+                subtype='PCM_16', format='WAV',
+            )
+        except ImportError:
+            import wave
+            with wave.open(buffer, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)  # 16-bit
+                wav_file.setframerate(24000)
+                wav_file.writeframes(pcm)
+
+        return buffer.getvalue()
+
     def speak(
         self,
         text: str,
@@ -232,6 +740,13 @@ class KokoroEngine(TTSEngine):
 
     def _create_pipeline(self, lang_code: str):
         """Initialize Kokoro pipeline with device handling."""
+        if self._device == "cuda":
+            # Must land before torch is first imported to take effect
+            os.environ.setdefault(
+                "PYTORCH_CUDA_ALLOC_CONF",
+                "expandable_segments:True,max_split_size_mb:64",
+            )
+
         from kokoro import KPipeline
 
         try:
@@ -244,6 +759,125 @@ class KokoroEngine(TTSEngine):
 
         return KPipeline(lang_code=lang_code)
 
+    def _inference_ctx(self):
+        """
+        Context for synthesis passes: autograd fully off via
+        inference_mode (skips version counters and view tracking that
+        no_grad still pays for) and, on CUDA, the reusable memory pool.
+        """
+        stack = contextlib.ExitStack()
+        try:
+            import torch
+        except ImportError:
+            return stack
+        stack.enter_context(torch.inference_mode())
+        if self._mem_pool is not None:
+            stack.enter_context(torch.cuda.use_mem_pool(self._mem_pool))
+        if self._device == "cuda" and self._dtype in ("fp16", "auto"):
+            # Pair the fp16 weights from _apply_dtype with autocast so
+            # intermediate activations stay half precision too
+            stack.enter_context(torch.autocast("cuda", dtype=torch.float16))
+        return stack
+
+    def _apply_dtype(self) -> None:
+        """
+        Downcast pipeline weights per self._dtype.
+
+        CPU synthesis is memory-bound, so int8 weights roughly halve the
+        per-layer byte traffic vs fp32; on CUDA, fp16 halves bandwidth.
+        Falls back to the loaded precision if the cast is unsupported.
+        """
+        model = getattr(self._pipeline, "model", None)
+        if model is None:
+            return
+
+        dtype = self._dtype
+        if dtype == "auto":
+            dtype = "fp16" if self._device == "cuda" else "q8"
+
+        if dtype not in ("q8", "fp16"):
+            return
+
+        try:
+            import torch
+
+            if dtype == "fp16" and self._device == "cuda":
+                self._pipeline.model = model.half()
+                logger.info("Kokoro weights downcast to fp16")
+            elif dtype == "q8" and self._device == "cpu":
+                # Quantizing 82M params takes a noticeable chunk of every
+                # cold start, and the result is deterministic - persist
+                # the quantized module once and mmap it back afterwards
+                cached = self._load_cached_q8(torch)
+                if cached is not None:
+                    self._pipeline.model = cached
+                    logger.info("Kokoro int8 weights loaded from cache")
+                else:
+                    self._pipeline.model = torch.quantization.quantize_dynamic(
+                        model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    self._save_cached_q8(torch, self._pipeline.model)
+                    logger.info("Kokoro weights quantized to int8 (dynamic)")
+
+        except Exception as e:
+            logger.warning(f"Kokoro dtype downcast ({dtype}) skipped: {e}")
+
+    def _q8_cache_path(self, torch) -> Path:
+        """Cache file for the quantized model, keyed by torch version."""
+        tag = torch.__version__.split("+")[0]
+        return self._cache_dir / f"kokoro_q8_torch{tag}.pt"
+
+    def _load_cached_q8(self, torch):
+        """
+        Load the cached int8 model, or None if absent/unreadable.
+
+        mmap=True keeps the weight pages on disk until first touch, so
+        startup pays only the pickle walk rather than a full read.
+        """
+        path = self._q8_cache_path(torch)
+        if not path.exists():
+            return None
+        try:
+            try:
+                return torch.load(
+                    path, map_location="cpu", mmap=True, weights_only=False
+                )
+            except TypeError:
+                # Older torch without mmap/weights_only kwargs
+                return torch.load(path, map_location="cpu")
+        except Exception as e:
+            logger.warning(f"Stale Kokoro q8 cache at {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _save_cached_q8(self, torch, model) -> None:
+        """Persist the quantized model for later cold starts."""
+        path = self._q8_cache_path(torch)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            torch.save(model, tmp)
+            tmp.replace(path)
+        except Exception as e:
+            logger.debug(f"Kokoro q8 cache not written: {e}")
+
+    def _cache_g2p(self) -> None:
+        """Wrap the pipeline's G2P callable with an LRU cache."""
+        g2p = getattr(self._pipeline, "g2p", None)
+        if g2p is None or not callable(g2p):
+            return
+        if getattr(g2p, "_panda_g2p_cache", False):
+            return
+
+        try:
+            import functools
+            cached = functools.lru_cache(maxsize=2048)(g2p)
+            cached._panda_g2p_cache = True
+            self._pipeline.g2p = cached
+            logger.debug("Kokoro G2P wrapped with lru_cache(2048)")
+        except Exception as e:
+            logger.debug(f"G2P caching skipped: {e}")
+
     def _should_retry_on_cpu(self, error: Exception) -> bool:
         if self._device == "cpu":
             return False
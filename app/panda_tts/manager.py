@@ -59,6 +59,7 @@ class TTSManager:
         output_dir: Optional[Path] = None,
         voice_name: Optional[str] = None,
         speed: float = 1.0,
+        dtype: Optional[str] = None,
     ) -> TTSEngine:
         """
         Initialize TTS engine with fallback.
@@ -70,6 +71,7 @@ class TTSManager:
             output_dir: Audio output directory
             voice_name: Voice ID (default: michael)
             speed: Speech speed multiplier (0.5-2.0)
+            dtype: Weight precision (q8, fp16, fp32, auto)
 
         Returns:
             Initialized TTSEngine
@@ -89,6 +91,12 @@ class TTSManager:
             if device not in ("cuda", "cpu"):
                 device = "cpu"
 
+        if dtype is None:
+            dtype = os.environ.get("PANDA_TTS_DTYPE", "").lower()
+            # fp16 on CUDA, int8 on CPU unless explicitly overridden
+            if dtype not in ("q8", "fp16", "fp32"):
+                dtype = "fp16" if device == "cuda" else "q8"
+
         # Default directories
         panda_home = Path.home() / ".panda1"
         output_dir = output_dir or panda_home / "audio_out"
@@ -96,7 +104,7 @@ class TTSManager:
         # Try engines in order
         if engine == "kokoro" or engine == "":
             # Kokoro is default
-            self._engine = self._try_kokoro(output_dir, voice_name, speed, device)
+            self._engine = self._try_kokoro(output_dir, voice_name, speed, device, dtype)
             if not self._engine:
                 self._engine = self._create_null()
         elif engine == "null" or engine == "off" or engine == "none":
@@ -104,7 +112,7 @@ class TTSManager:
         else:
             # Unknown engine - try Kokoro then null
             logger.warning(f"Unknown TTS engine '{engine}', trying Kokoro")
-            self._engine = self._try_kokoro(output_dir, voice_name, speed, device)
+            self._engine = self._try_kokoro(output_dir, voice_name, speed, device, dtype)
             if not self._engine:
                 self._engine = self._create_null()
 
@@ -120,6 +128,7 @@ class TTSManager:
         voice_name: str,
         speed: float,
         device: str,
+        dtype: str = "q8",
     ) -> Optional[TTSEngine]:
         """Try to initialize Kokoro."""
         try:
@@ -130,6 +139,7 @@ class TTSManager:
                 speed=speed,
                 output_dir=output_dir,
                 device=device,
+                dtype=dtype,
             )
 
             if engine.warmup():
@@ -200,6 +210,46 @@ class TTSManager:
 
         return self._engine.speak(text, lang, blocking)
 
+    def speak_batch(
+        self,
+        texts: list,
+        lang: Optional[Literal["en", "ko"]] = None,
+        blocking: bool = False
+    ) -> bool:
+        """
+        Speak several short texts as one engine invocation.
+
+        Fuses the prompts into a single utterance so the engine pays one
+        warm forward pass instead of N separate speak() round-trips
+        (KPipeline has no batch dimension, so fusion is the batching).
+
+        Args:
+            texts: Texts to speak, in order
+            lang: Language for the whole batch (auto-detected if None)
+            blocking: Wait for speech to complete
+
+        Returns:
+            True if speech started
+        """
+        if not self._engine:
+            logger.error("TTS not initialized")
+            return False
+
+        parts = []
+        for text in texts:
+            text = text.strip()
+            if not text:
+                continue
+            # Ensure a sentence boundary so Kokoro inserts a natural pause
+            if text[-1] not in ".!?。！？":
+                text += "."
+            parts.append(text)
+
+        if not parts:
+            return False
+
+        return self.speak(" ".join(parts), lang, blocking)
+
     @staticmethod
     def _normalize_pronunciations(text: str) -> str:
         """Normalize tokens for desired pronunciations in TTS output."""
@@ -16,6 +16,7 @@ Features:
 import os
 import logging
 import shutil
+import struct
 import subprocess
 import threading
 import queue
@@ -24,6 +25,10 @@ from typing import Optional, Callable, Tuple, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Canonical 44-byte PCM WAV header, compiled once so writers can pack
+# the whole thing in a single call instead of one write per field
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
 
 def get_alsa_device() -> str:
     """Get ALSA device from environment."""
@@ -122,9 +127,8 @@ def test_audio_playback() -> bool:
     Returns:
         True if audio played successfully
     """
-    import struct
     import math
-    
+
     logging.info("=" * 60)
     logging.info("  PANDA.1 Audio Test")
     logging.info("=" * 60)
@@ -154,23 +158,15 @@ def test_audio_playback() -> bool:
     
     audio_data = b''.join(samples)
     
-    # Write WAV file (PCM_16)
-    with open(test_wav, 'wb') as f:
-        # WAV header
-        f.write(b'RIFF')
-        f.write(struct.pack('<I', 36 + len(audio_data)))
-        f.write(b'WAVE')
-        f.write(b'fmt ')
-        f.write(struct.pack('<I', 16))  # Subchunk1Size
-        f.write(struct.pack('<H', 1))   # AudioFormat (PCM)
-        f.write(struct.pack('<H', 1))   # NumChannels
-        f.write(struct.pack('<I', sample_rate))  # SampleRate
-        f.write(struct.pack('<I', sample_rate * 2))  # ByteRate
-        f.write(struct.pack('<H', 2))   # BlockAlign
-        f.write(struct.pack('<H', 16))  # BitsPerSample
-        f.write(b'data')
-        f.write(struct.pack('<I', len(audio_data)))
-        f.write(audio_data)
+    # Write WAV file (PCM_16): header packed in one shot, one write
+    header = _WAV_HEADER.pack(
+        b'RIFF', 36 + len(audio_data), b'WAVE',
+        b'fmt ', 16, 1, 1,                 # Subchunk1Size, PCM, mono
+        sample_rate, sample_rate * 2,      # SampleRate, ByteRate
+        2, 16,                             # BlockAlign, BitsPerSample
+        b'data', len(audio_data),
+    )
+    test_wav.write_bytes(header + audio_data)
     
     logging.info(f"Generated test beep: {test_wav}")
     logging.info("Playing...")
@@ -347,12 +343,14 @@ class AudioPlayer:
             cmd = self._player_cmd + [str(audio_path)]
             logger.info(f"Playing: {' '.join(cmd)}")
             
+            # stdout is never read - discard it at the OS level so only
+            # the error channel costs a pipe
             self._playback_process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE
             )
-            
+
             # Wait for playback to complete
             while self._playback_process.poll() is None:
                 if self._stop_event.is_set():
@@ -360,9 +358,9 @@ class AudioPlayer:
                     self._last_error = "Playback stopped by user"
                     break
                 self._stop_event.wait(0.1)
-            
+
             # Capture output
-            stdout, stderr = self._playback_process.communicate(timeout=1)
+            _, stderr = self._playback_process.communicate(timeout=1)
             return_code = self._playback_process.returncode
             
             if return_code != 0 and not self._stop_event.is_set():
@@ -0,0 +1,513 @@
+"""
+PANDA.1 Streaming TTS
+=====================
+Pipelined text -> synthesis -> playback for low time-to-first-sample.
+
+Version: 2.0
+
+Instead of synthesizing a full reply before the audio device starts,
+TTSStreamer extracts sentence-sized chunks from incoming text, synthesizes
+them on a worker thread, and plays each chunk while the next one is being
+generated. Synthesis and playback overlap, so time-to-first-sample drops
+to roughly one chunk's synthesis time instead of the whole reply's.
+
+Usage:
+    streamer = TTSStreamer(engine)
+    for token in llm_stream:
+        streamer.feed(token)
+    streamer.end()
+    streamer.wait()
+"""
+
+import io
+import re
+import wave
+import logging
+import threading
+import queue
+from collections import deque
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .base import TTSEngine, detect_language
+
+logger = logging.getLogger(__name__)
+
+# Bounded so a long reply cannot synthesize unboundedly ahead of playback
+AUDIO_QUEUE_SIZE = 4
+
+# Chunks longer than this are split further before synthesis
+MAX_CHUNK_CHARS = 300
+
+# Queued same-language sentences are folded into one synthesis call
+# until their combined length reaches this, amortizing per-invocation
+# model overhead across very short sentences
+_BATCH_MAX_CHARS = 200
+
+# Compiled once: feed() runs these per token, and going through
+# re.search(str, ...) pays a pattern-cache dict lookup on every call
+_SENTENCE_END_RE = re.compile(r'[.!?。！？]+(?:\s+|$)')
+_CLAUSE_SPLIT_RE = re.compile(r'[,;，；]\s*')
+
+# Every character the sentence regex can start a match on. Most LLM
+# tokens contain none of these, and frozenset.isdisjoint(token) checks
+# that in one C call - cheaper than joining the buffer and invoking
+# the regex engine just to find nothing.
+_TERMINATORS = frozenset('.!?。！？')
+
+
+class _Channel:
+    """
+    Single-producer/single-consumer queue: a deque under one Condition.
+
+    queue.Queue layers task-tracking (unfinished_tasks, join) and three
+    separate Conditions on top of its deque; the streamer needs none of
+    that, and this drops the per-item overhead to one lock round-trip.
+    A maxsize of 0 means unbounded; a bounded put blocks for
+    backpressure. clear() is O(1) and wakes any blocked producer.
+    """
+
+    __slots__ = ('_items', '_cond', '_maxsize')
+
+    def __init__(self, maxsize: int = 0):
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._maxsize = maxsize
+
+    def put(self, item) -> None:
+        with self._cond:
+            while self._maxsize and len(self._items) >= self._maxsize:
+                self._cond.wait()
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None):
+        """Pop the oldest item, raising queue.Empty on timeout."""
+        with self._cond:
+            if not self._items:
+                if not self._cond.wait_for(lambda: self._items, timeout):
+                    raise queue.Empty
+            item = self._items.popleft()
+            self._cond.notify()
+            return item
+
+    def clear(self) -> None:
+        with self._cond:
+            self._items.clear()
+            self._cond.notify_all()
+
+
+@dataclass(slots=True)
+class StreamChunk:
+    """A sentence-sized piece of text queued for synthesis."""
+    text: str
+    lang: str
+
+
+class StreamingPlayer:
+    """
+    Plays audio chunks through one persistent sounddevice stream.
+
+    sd.play()/sd.wait() per chunk opens and tears down a PortAudio
+    stream each time - heavy relative to a ~200ms TTS chunk, and the
+    stop/start seam is an audible gap. A single OutputStream is opened
+    on the first chunk and written to from then on; stream.write()
+    blocks on the device buffer, which doubles as backpressure.
+    """
+
+    def __init__(self):
+        self._stream = None
+        self._stream_rate: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def play(self, wav_bytes: bytes) -> bool:
+        """Play one WAV chunk, blocking until it is queued to the device."""
+        try:
+            import numpy as np
+        except ImportError:
+            logger.warning("numpy not available for streaming playback")
+            return False
+
+        try:
+            with wave.open(io.BytesIO(wav_bytes), 'rb') as wav:
+                sample_rate = wav.getframerate()
+                frames = wav.readframes(wav.getnframes())
+        except Exception as e:
+            logger.error(f"Streaming playback failed: {e}")
+            return False
+
+        # PortAudio takes int16 natively; no float32 upcast needed
+        return self.play_pcm(np.frombuffer(frames, dtype=np.int16), sample_rate)
+
+    def play_pcm(self, pcm, sample_rate: int) -> bool:
+        """Play one raw int16 PCM chunk through the persistent stream."""
+        try:
+            import sounddevice as sd
+        except ImportError:
+            logger.warning("sounddevice not available for streaming playback")
+            return False
+
+        try:
+            with self._lock:
+                stream = self._ensure_stream(sd, sample_rate)
+            stream.write(pcm)
+            return True
+
+        except Exception as e:
+            logger.error(f"Streaming playback failed: {e}")
+            return False
+
+    def _ensure_stream(self, sd, sample_rate: int):
+        """Open (or reopen on a rate change) the shared output stream."""
+        if self._stream is None or self._stream_rate != sample_rate:
+            self._close_stream()
+            self._stream = sd.OutputStream(
+                samplerate=sample_rate, channels=1, dtype='int16'
+            )
+            self._stream.start()
+            self._stream_rate = sample_rate
+        return self._stream
+
+    def _close_stream(self) -> None:
+        """Tear down the output stream. Must hold self._lock."""
+        if self._stream is not None:
+            try:
+                self._stream.abort()
+                self._stream.close()
+            except Exception:
+                pass
+            self._stream = None
+            self._stream_rate = None
+
+    def stop(self) -> None:
+        """Abort any chunk currently playing and drop the stream."""
+        with self._lock:
+            self._close_stream()
+
+
+# Marks end-of-reply in the raw token deque
+_END_OF_TEXT = object()
+
+
+def _trimmed_slice(buf: str, start: int, end: int) -> str:
+    """Slice buf[start:end] minus surrounding whitespace, allocating once."""
+    while start < end and buf[start].isspace():
+        start += 1
+    while end > start and buf[end - 1].isspace():
+        end -= 1
+    return buf[start:end]
+
+
+class TTSStreamer:
+    """
+    Three-stage pipeline: chunker -> synthesis worker -> playback worker.
+
+    feed() only appends the raw token to a deque (atomic in CPython)
+    and sets an event, so the LLM token loop pays no lock or regex
+    work. The chunker thread drains tokens, cuts complete sentences at
+    boundaries, and queues them; the synthesis worker turns sentences
+    into audio behind a bounded queue; the playback worker drains that
+    queue so the audio device is busy while the next chunk is still
+    synthesizing.
+
+    Threading contract (single-producer/single-consumer throughout):
+    feed() and end() must be called from one thread - the token deque
+    append needs no lock only because there is a single producer. The
+    text buffer and scan offset are owned exclusively by the chunker
+    thread, and each _Channel has exactly one producer and one
+    consumer. stop() may be called from any thread; it only sets
+    events and clears queues. If a second feeder thread ever becomes
+    necessary, reintroduce a lock around feed() rather than widening
+    the deque's guarantees.
+    """
+
+    def __init__(
+        self,
+        engine: TTSEngine,
+        lang: Optional[str] = None,
+        text_filter: Optional[Callable[[str], str]] = None,
+    ):
+        """
+        Initialize streamer.
+
+        Args:
+            engine: TTS engine used for synthesis
+            lang: Language override (None for per-chunk auto-detect)
+            text_filter: Optional transform applied to each extracted
+                sentence before synthesis (e.g. the TTS manager's
+                pronunciation normalization), so streamed speech sounds
+                the same as the non-streaming path
+        """
+        self._engine = engine
+        self._lang = lang
+        self._text_filter = text_filter
+        self._player = StreamingPlayer()
+
+        # Raw tokens from feed(), handed to the chunker thread.
+        # deque.append is atomic under the GIL, so the producer path
+        # needs no lock; the event wakes the chunker.
+        self._raw_tokens: deque = deque()
+        self._token_event = threading.Event()
+
+        # Chunker-thread state: pending text as a list of fed fragments
+        # (appending is O(1) where growing an immutable str copies the
+        # whole buffer per token), joined only when the scanner needs a
+        # contiguous view, plus the scan-resume offset.
+        self._buffer_parts: list = []
+        self._scan_offset = 0
+
+        self._text_queue = _Channel()
+        self._audio_queue = _Channel(maxsize=AUDIO_QUEUE_SIZE)
+        self._stop_event = threading.Event()
+
+        self._chunker_thread: Optional[threading.Thread] = None
+        self._synthesis_thread: Optional[threading.Thread] = None
+        self._playback_thread: Optional[threading.Thread] = None
+        self._started = False
+
+    def feed(self, text: str) -> None:
+        """Add streamed text; complete sentences are queued for synthesis."""
+        if not text or self._stop_event.is_set():
+            return
+
+        self._ensure_workers()
+        self._raw_tokens.append(text)
+        self._token_event.set()
+
+    def end(self) -> None:
+        """Signal end of text; flush any buffered remainder."""
+        if not self._started:
+            return
+
+        self._raw_tokens.append(_END_OF_TEXT)
+        self._token_event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for all queued chunks to be synthesized and played."""
+        if self._playback_thread and self._playback_thread.is_alive():
+            self._playback_thread.join(timeout=timeout)
+
+    def stop(self) -> None:
+        """Stop synthesis and playback, discarding queued chunks."""
+        self._stop_event.set()
+        self._token_event.set()
+
+        self._raw_tokens.clear()
+        self._text_queue.clear()
+        self._audio_queue.clear()
+
+        self._player.stop()
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the pipeline is still producing or playing audio."""
+        return bool(self._playback_thread and self._playback_thread.is_alive())
+
+    def _ensure_workers(self) -> None:
+        """Start the synthesis and playback threads once."""
+        if self._started:
+            return
+
+        self._started = True
+        self._chunker_thread = threading.Thread(
+            target=self._chunker_worker, daemon=True
+        )
+        self._synthesis_thread = threading.Thread(
+            target=self._synthesis_worker, daemon=True
+        )
+        self._playback_thread = threading.Thread(
+            target=self._playback_worker, daemon=True
+        )
+        self._chunker_thread.start()
+        self._synthesis_thread.start()
+        self._playback_thread.start()
+
+    def _chunker_worker(self) -> None:
+        """Drain raw tokens and cut them into sentence chunks."""
+        while not self._stop_event.is_set():
+            if not self._token_event.wait(timeout=0.5):
+                continue
+            self._token_event.clear()
+
+            ended = False
+            saw_terminator = False
+            while True:
+                try:
+                    token = self._raw_tokens.popleft()
+                except IndexError:
+                    break
+                if token is _END_OF_TEXT:
+                    ended = True
+                    break
+                self._buffer_parts.append(token)
+                if not saw_terminator and not _TERMINATORS.isdisjoint(token):
+                    saw_terminator = True
+
+            # A sentence can only complete if this batch brought a
+            # terminator (one already buffered either matched at $ and
+            # was consumed, or is followed by a non-space forever)
+            if not saw_terminator and not ended:
+                continue
+
+            for chunk in self._extract_chunks(final=ended):
+                self._text_queue.put(chunk)
+
+            if ended:
+                self._text_queue.put(None)
+                break
+
+    def _extract_chunks(self, final: bool = False) -> list:
+        """
+        Cut complete sentences off the front of the text buffer.
+
+        Runs only on the chunker thread, which owns the buffer state.
+
+        Args:
+            final: If True, also flush the trailing partial sentence
+
+        Returns:
+            List of StreamChunk ready for synthesis
+        """
+        chunks = []
+        buf = ''.join(self._buffer_parts)
+
+        # Walk the buffer with indices; each emitted sentence costs one
+        # slice via _trimmed_slice instead of a cut slice, a strip copy,
+        # and a tail reslice per iteration
+        start = 0
+        pos = self._scan_offset
+
+        while True:
+            match = _SENTENCE_END_RE.search(buf, pos)
+            if not match:
+                # A terminator the scan passed over is followed by a
+                # non-space character and can never match later (one at
+                # the buffer end matches immediately via $), so the next
+                # scan only needs to cover newly fed text. Offset is
+                # relative to the tail written back below.
+                self._scan_offset = len(buf) - start
+                break
+
+            end = match.end()
+            sentence = _trimmed_slice(buf, start, end)
+            start = pos = end
+
+            if sentence:
+                chunks.append(self._make_chunk(sentence))
+
+        if final:
+            remainder = _trimmed_slice(buf, start, len(buf))
+            start = len(buf)
+            self._scan_offset = 0
+            if remainder:
+                chunks.append(self._make_chunk(remainder))
+
+        tail = buf[start:]
+        self._buffer_parts = [tail] if tail else []
+        return chunks
+
+    def _make_chunk(self, text: str) -> StreamChunk:
+        """Build a StreamChunk, filtered and with its language resolved."""
+        if self._text_filter is not None:
+            text = self._text_filter(text)
+        lang = self._lang or detect_language(text)
+        return StreamChunk(text=text, lang=lang)
+
+    def _synthesis_worker(self) -> None:
+        """Synthesize queued text chunks into audio."""
+        pending: Optional[StreamChunk] = None
+        done = False
+
+        while not self._stop_event.is_set() and not done:
+            if pending is not None:
+                chunk, pending = pending, None
+            else:
+                try:
+                    chunk = self._text_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if chunk is None:
+                    break
+
+            # Fold queued same-language sentences into one synthesis
+            # call: very short sentences ("Okay.", "Sure!") otherwise
+            # pay full per-invocation model overhead each. A chunk of
+            # a different language is held over for the next round.
+            texts = [chunk.text]
+            total = len(chunk.text)
+            while total < _BATCH_MAX_CHARS:
+                try:
+                    nxt = self._text_queue.get(timeout=0)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    done = True
+                    break
+                if nxt.lang != chunk.lang:
+                    pending = nxt
+                    break
+                texts.append(nxt.text)
+                total += len(nxt.text)
+
+            if len(texts) > 1:
+                chunk = StreamChunk(text=' '.join(texts), lang=chunk.lang)
+
+            try:
+                for audio in self._synthesize_chunk(chunk):
+                    if self._stop_event.is_set():
+                        break
+                    self._audio_queue.put(audio)
+            except Exception as e:
+                logger.error(f"Streaming synthesis error: {e}")
+
+        # Signal playback worker that no more audio is coming
+        self._audio_queue.put(None)
+
+    def _synthesize_chunk(self, chunk: StreamChunk):
+        """
+        Yield WAV bytes for one text chunk.
+
+        Prefers the engine's raw synthesize_chunks_pcm() (yielding
+        (int16 array, rate) tuples straight to the audio device), then
+        WAV-framed synthesize_chunks(), then whole-chunk file synthesis.
+        """
+        text = chunk.text
+        if len(text) > MAX_CHUNK_CHARS:
+            # Crude split at commas/spaces for overlong sentences
+            parts = _CLAUSE_SPLIT_RE.split(text)
+        else:
+            parts = [text]
+
+        synthesize_pcm = getattr(self._engine, "synthesize_chunks_pcm", None)
+        synthesize_chunks = getattr(self._engine, "synthesize_chunks", None)
+
+        for part in parts:
+            part = part.strip()
+            if not part or self._stop_event.is_set():
+                continue
+
+            if synthesize_pcm is not None:
+                yield from synthesize_pcm(part, chunk.lang)
+            elif synthesize_chunks is not None:
+                yield from synthesize_chunks(part, chunk.lang)
+            else:
+                audio_path = self._engine.synthesize(part, chunk.lang)
+                if audio_path:
+                    yield Path(audio_path).read_bytes()
+
+    def _playback_worker(self) -> None:
+        """Play synthesized audio chunks as they become available."""
+        while not self._stop_event.is_set():
+            try:
+                item = self._audio_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            if item is None:
+                break
+
+            if isinstance(item, tuple):
+                self._player.play_pcm(*item)
+            else:
+                self._player.play(item)
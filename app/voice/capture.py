@@ -44,9 +44,19 @@ class CaptureState(Enum):
 
 @dataclass
 class CaptureResult:
-    """Result of an audio capture session."""
+    """
+    Result of an audio capture session.
+
+    Invariant: `samples`, when set, is mono float32 at 16kHz normalized
+    to [-1, 1] - the layout Whisper consumes directly, so STT never
+    needs to resample or dtype-convert. Captures configured with any
+    other rate or channel count leave it None and consumers fall back
+    to `audio_data`, the same audio encoded once as PCM_16 WAV bytes,
+    which the STT path decodes and resamples correctly.
+    """
     success: bool
     audio_data: Optional[bytes] = None
+    samples: Optional["np.ndarray"] = None
     duration: float = 0.0
     rms: float = 0.0
     peak: float = 0.0
@@ -244,20 +254,33 @@ class AudioCapture:
                 
                 audio_data = np.concatenate(self._frames, axis=0)
                 self._frames = []
-            
+
+            flat = np.ascontiguousarray(
+                audio_data.reshape(-1), dtype=np.float32
+            )
+
+            # The pre-decoded Whisper layout only holds when the capture
+            # is already canonical mono 16kHz; at any other rate (or with
+            # interleaved multi-channel data, which reshape does not
+            # downmix) hand out None so consumers take the WAV-bytes
+            # path, which decodes and resamples correctly
+            samples = None
+            if self.sample_rate == 16000 and self.channels == 1:
+                samples = flat
+
             # Calculate stats
-            rms = float(np.sqrt(np.mean(audio_data ** 2)))
-            peak = float(np.max(np.abs(audio_data)))
-            
+            rms = float(np.sqrt(np.mean(flat ** 2)))
+            peak = float(np.max(np.abs(flat)))
+
             # Convert to WAV bytes
             wav_buffer = io.BytesIO()
             with wave.open(wav_buffer, 'wb') as wav_file:
                 wav_file.setnchannels(self.channels)
                 wav_file.setsampwidth(2)  # 16-bit
                 wav_file.setframerate(self.sample_rate)
-                
+
                 # Convert float32 to int16
-                audio_int16 = (audio_data * 32767).astype(np.int16)
+                audio_int16 = (flat * 32767).astype(np.int16)
                 wav_file.writeframes(audio_int16.tobytes())
             
             wav_bytes = wav_buffer.getvalue()
@@ -277,6 +300,7 @@ class AudioCapture:
             return CaptureResult(
                 success=True,
                 audio_data=wav_bytes,
+                samples=samples,
                 duration=duration,
                 rms=rms,
                 peak=peak,
@@ -13,9 +13,11 @@ Features:
 """
 
 import time
+import wave
 import logging
 import threading
 import shutil
+from collections import OrderedDict
 from enum import Enum, auto
 from pathlib import Path
 from typing import Optional, Callable, Generator
@@ -25,7 +27,7 @@ from .voice_config import VoiceConfig, get_voice_config, LanguageMode
 from .devices import list_input_devices, list_output_devices, get_device_info
 from .capture import AudioCapture, CaptureState, CaptureResult
 from .stt_faster_whisper import FasterWhisperSTT, STTResult, STTLanguage
-from app.panda_tts import get_tts_manager, stop_speech, detect_language
+from app.panda_tts import get_tts_manager, stop_speech, detect_language, TTSStreamer
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +81,17 @@ class VoiceManager:
         # Streaming TTS
         vm.speak_streaming(text_generator)
     """
-    
+
+    # Idle window before a debounced config save hits disk
+    SAVE_DEBOUNCE_SEC = 0.5
+
+    # Minimum spacing between UI level-meter callbacks (30Hz)
+    LEVEL_CALLBACK_INTERVAL = 1.0 / 30.0
+
+    # Replay cache for repeated short prompts
+    TTS_CACHE_MAX_BYTES = 5 * 1024 * 1024
+    TTS_CACHE_MAX_TEXT = 200
+
     def __init__(self, config: Optional[VoiceConfig] = None):
         """
         Initialize voice manager.
@@ -93,10 +105,23 @@ class VoiceManager:
         self._capture: Optional[AudioCapture] = None
         self._stt: Optional[FasterWhisperSTT] = None
         self._tts_manager = None
+        self._streamer: Optional[TTSStreamer] = None
         
         self._initialized = False
         self._lock = threading.Lock()
-        
+
+        # Debounced config persistence
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+
+        # UI level-meter throttling
+        self._last_level_cb = 0.0
+
+        # LRU of decoded PCM keyed by (text, lang, voice, dtype); repeated
+        # UI prompts replay from here without a synthesis pass
+        self._tts_cache: OrderedDict = OrderedDict()
+        self._tts_cache_bytes = 0
+
         # Callbacks
         self._on_state_change: Optional[Callable[[VoiceState], None]] = None
         self._on_level_update: Optional[Callable[[float], None]] = None
@@ -176,6 +201,7 @@ class VoiceManager:
                 engine="kokoro",
                 device=self.config.tts_device,
                 voice_name=self.config.tts_voice_en,
+                dtype=self.config.tts_dtype,
             )
             
             self._initialized = True
@@ -234,16 +260,44 @@ class VoiceManager:
             return None
         
         logger.info(f"Captured {result.duration:.1f}s audio (RMS={result.rms:.3f})")
-        
+
+        # Early-out for too-short or near-silent clips: Whisper's
+        # temperature fallback can burn seconds decoding nothing
+        if (
+            result.duration < self.config.ptt_min_transcribe_sec
+            or result.rms < self.config.ptt_noise_floor
+        ):
+            logger.info(
+                f"Skipping transcription ({result.duration:.2f}s, RMS={result.rms:.4f})"
+            )
+            self._set_state(VoiceState.IDLE)
+            return None
+
+        # Whisper's internal Silero VAD pass is redundant for short PTT
+        # clips the capture layer already gated on duration and level
+        vad_filter = self.config.stt_vad_filter
+        if (
+            result.duration < self.config.stt_vad_skip_duration
+            and result.rms > self.config.stt_vad_skip_rms
+        ):
+            vad_filter = False
+
         # Transcribe
         stt_lang = self._get_stt_language()
+        # Prefer the pre-decoded float32 samples so the STT path skips
+        # re-parsing the WAV container entirely
         stt_result = self._stt.transcribe(
-            result.audio_data,
+            result.samples if result.samples is not None else result.audio_data,
             language=stt_lang,
             beam_size=self.config.stt_beam_size,
-            vad_filter=self.config.stt_vad_filter,
+            vad_filter=vad_filter,
         )
-        
+
+        # Drop the captured waveform now; holding it through the logging
+        # and callback tail keeps MBs pinned per utterance
+        result.audio_data = None
+        result.samples = None
+
         self._set_state(VoiceState.IDLE)
         
         if not stt_result.success:
@@ -303,9 +357,13 @@ class VoiceManager:
             self._set_state(VoiceState.IDLE)
             return False
 
-        # Speak
-        play_result = self._tts_manager.speak(text, lang, blocking=blocking)
-        
+        # Speak (replay cache first for short repeated prompts)
+        play_result = None
+        if len(text) <= self.TTS_CACHE_MAX_TEXT:
+            play_result = self._speak_cached(text, lang, blocking)
+        if play_result is None:
+            play_result = self._tts_manager.speak(text, lang, blocking=blocking)
+
         if blocking:
             self._set_state(VoiceState.IDLE)
         else:
@@ -318,14 +376,186 @@ class VoiceManager:
         
         return play_result
     
+    def _speak_cached(self, text: str, lang: str, blocking: bool) -> Optional[bool]:
+        """
+        Speak via the PCM replay cache.
+
+        On a hit, playback starts sub-millisecond with no synthesis pass.
+        On a blocking miss, the text is synthesized once, decoded, and
+        cached. A non-blocking miss falls back to the regular engine
+        path: synthesizing here would run on the caller's thread, and
+        speak(blocking=False) promises an immediate return.
+
+        Returns:
+            True if played from/into the cache, None to fall back to the
+            regular engine path
+        """
+        # Same normalization the fallback speak() path applies, so hit
+        # and miss playback pronounce identically (and cache keys match
+        # what actually gets synthesized)
+        text = self._tts_manager._normalize_pronunciations(text)
+
+        voice = self.config.tts_voice_ko if lang == "ko" else self.config.tts_voice_en
+        key = (text, lang, voice, self.config.tts_dtype)
+
+        entry = self._tts_cache.get(key)
+        if entry is not None:
+            self._tts_cache.move_to_end(key)
+            pcm, sample_rate = entry
+            return self._play_pcm(pcm, sample_rate, blocking)
+
+        if not blocking:
+            return None
+
+        pcm, sample_rate = None, 0
+
+        # Engines that can hand back the array directly skip the
+        # write-WAV-then-reopen round-trip entirely
+        engine = getattr(self._tts_manager, "engine", None)
+        synth_array = getattr(engine, "synthesize_array", None)
+        if synth_array is not None:
+            result = synth_array(text, lang)
+            if result is not None:
+                import numpy as np
+                audio, sample_rate = result
+                pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+
+        if pcm is None:
+            audio_path = self._tts_manager.synthesize(text, lang)
+            if not audio_path:
+                return None
+            pcm, sample_rate = self._load_pcm(audio_path)
+            if pcm is None:
+                return None
+
+        self._tts_cache_put(key, pcm, sample_rate)
+
+        return self._play_pcm(pcm, sample_rate, blocking)
+
+    def _tts_cache_put(self, key: tuple, pcm, sample_rate: int) -> None:
+        """Insert PCM into the replay cache, evicting LRU entries over budget."""
+        if pcm.nbytes > self.TTS_CACHE_MAX_BYTES:
+            return
+
+        old = self._tts_cache.pop(key, None)
+        if old is not None:
+            self._tts_cache_bytes -= old[0].nbytes
+
+        self._tts_cache[key] = (pcm, sample_rate)
+        self._tts_cache_bytes += pcm.nbytes
+
+        while self._tts_cache_bytes > self.TTS_CACHE_MAX_BYTES:
+            _, (evicted, _) = self._tts_cache.popitem(last=False)
+            self._tts_cache_bytes -= evicted.nbytes
+
+    @staticmethod
+    def _load_pcm(audio_path) -> tuple:
+        """Decode a synthesized WAV file to (int16 PCM, sample rate)."""
+        try:
+            import numpy as np
+
+            with wave.open(str(audio_path), 'rb') as wav:
+                sample_rate = wav.getframerate()
+                frames = wav.readframes(wav.getnframes())
+
+            return np.frombuffer(frames, dtype=np.int16), sample_rate
+
+        except Exception as e:
+            logger.debug(f"PCM decode failed: {e}")
+            return None, 0
+
+    def _play_pcm(self, pcm, sample_rate: int, blocking: bool) -> Optional[bool]:
+        """Play raw PCM via sounddevice; None on failure (caller falls back)."""
+        try:
+            import sounddevice as sd
+
+            sd.play(pcm, sample_rate, device=self.config.output_device)
+            if blocking:
+                sd.wait()
+            return True
+
+        except Exception as e:
+            logger.debug(f"Cached PCM playback failed: {e}")
+            return None
+
+    def speak_many(
+        self,
+        texts: list,
+        lang: Optional[str] = None,
+        blocking: bool = False,
+    ) -> bool:
+        """
+        Speak several short texts back-to-back as batched synthesis.
+
+        Groups texts by language and hands each group to the TTS manager
+        in one call, avoiding a separate engine invocation per prompt.
+
+        Args:
+            texts: Texts to speak, in order
+            lang: Language for all texts (or None for per-text auto-detect)
+            blocking: Wait for completion
+
+        Returns:
+            True if all groups were spoken successfully
+        """
+        if not texts:
+            return True
+
+        if not self._initialized:
+            if not self.initialize():
+                return False
+
+        if self.config.tts_muted or not self.config.tts_enabled:
+            return True
+
+        if not self._tts_manager or not self._tts_manager.is_ready:
+            logger.warning("TTS manager not ready")
+            return False
+
+        # Group consecutive texts by language, preserving order
+        groups = []
+        for text in texts:
+            if not text or not text.strip():
+                continue
+            text_lang = lang
+            if text_lang is None:
+                if self.config.language_mode == LanguageMode.AUTO:
+                    text_lang = detect_language(text)
+                else:
+                    text_lang = self.config.language_mode.value
+            if groups and groups[-1][0] == text_lang:
+                groups[-1][1].append(text)
+            else:
+                groups.append((text_lang, [text]))
+
+        if not groups:
+            return True
+
+        self._set_state(VoiceState.SPEAKING)
+
+        success = True
+        for group_lang, group_texts in groups:
+            if not self._tts_manager.speak_batch(
+                group_texts, group_lang, blocking=blocking
+            ):
+                success = False
+
+        if blocking:
+            self._set_state(VoiceState.IDLE)
+
+        return success
+
     def speak_streaming(
         self,
         text_stream: Generator[str, None, None],
         lang: Optional[str] = None,
     ) -> None:
         """
-        Speak text once the stream completes (Kokoro does not support streaming).
-        
+        Speak streamed text, pipelining synthesis with playback.
+
+        Sentences are synthesized and played as they complete, so audio
+        starts after the first sentence instead of the full stream.
+
         Args:
             text_stream: Generator yielding text tokens
             lang: Language (or None for auto-detect)
@@ -333,61 +563,110 @@ class VoiceManager:
         if not self._initialized:
             if not self.initialize():
                 return
-        
+
         if self.config.tts_muted or not self.config.tts_enabled:
             # Still consume the stream
             for _ in text_stream:
                 pass
             return
-        
+
+        engine = self._tts_manager.engine if self._tts_manager else None
+        if engine is None or not self._tts_manager.is_ready:
+            logger.warning("TTS manager not ready for streaming")
+            for _ in text_stream:
+                pass
+            return
+
         self._set_state(VoiceState.SPEAKING)
 
-        # Collect streamed text and speak once complete
+        # Feed the stream into the synthesis/playback pipeline
         def _stream_worker():
+            # The filter keeps streamed speech pronouncing identically
+            # to the speak() path, which normalizes before synthesis
+            streamer = TTSStreamer(
+                engine,
+                lang=lang,
+                text_filter=self._tts_manager._normalize_pronunciations,
+            )
+            self._streamer = streamer
             try:
-                tokens = []
                 for token in text_stream:
-                    tokens.append(token)
-
-                combined = "".join(tokens).strip()
-                if combined:
-                    self.speak(combined, lang, blocking=True)
+                    streamer.feed(token)
+                streamer.end()
+                streamer.wait()
             finally:
+                self._streamer = None
                 self._set_state(VoiceState.IDLE)
-        
+
         threading.Thread(target=_stream_worker, daemon=True).start()
-    
+
     def stop_speaking(self) -> None:
         """Stop current TTS playback."""
+        streamer = self._streamer
+        if streamer is not None:
+            streamer.stop()
         stop_speech()
         self._set_state(VoiceState.IDLE)
-    
+        self.flush_config()
+
     def set_mute(self, muted: bool) -> None:
         """Set TTS mute state."""
         self.config.tts_muted = muted
-        self.config.save()
-    
+        self._schedule_save()
+
     def set_volume(self, volume: float) -> None:
         """Set TTS volume (0.0 - 1.0)."""
         self.config.tts_volume = max(0.0, min(1.0, volume))
-        self.config.save()
-    
+        self._schedule_save()
+
     def set_language_mode(self, mode: LanguageMode) -> None:
         """Set language mode."""
         self.config.language_mode = mode
-        self.config.save()
-    
+        self._schedule_save()
+
     def set_input_device(self, device_index: Optional[int]) -> None:
         """Set input device."""
         self.config.input_device = device_index
         if self._capture:
             self._capture.set_device(device_index)
-        self.config.save()
-    
+        self._schedule_save()
+
     def set_output_device(self, device_index: Optional[int]) -> None:
         """Set output device."""
         self.config.output_device = device_index
+        self._schedule_save()
+
+    def flush_config(self) -> None:
+        """Force any pending config save to disk immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+                self.config.save()
+
+    def _schedule_save(self) -> None:
+        """
+        Debounce config writes: coalesce rapid setter calls (e.g. a volume
+        slider drag) into a single disk write after a short idle window.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SEC, self._do_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _do_save(self) -> None:
+        """Perform the debounced config write."""
+        with self._save_lock:
+            self._save_timer = None
         self.config.save()
+
+    def __del__(self):
+        try:
+            self.flush_config()
+        except Exception:
+            pass
     
     def get_status(self) -> dict:
         """Get voice system status."""
@@ -412,6 +691,12 @@ class VoiceManager:
     def _handle_level_update(self, level: float) -> None:
         """Handle audio level update from capture."""
         if self._on_level_update:
+            # Throttle UI updates to 30Hz; the meter can't show more and
+            # each callback steals GIL time from the capture thread
+            now = time.monotonic()
+            if now - self._last_level_cb < self.LEVEL_CALLBACK_INTERVAL:
+                return
+            self._last_level_cb = now
             try:
                 self._on_level_update(level)
             except Exception as e:
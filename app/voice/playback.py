@@ -16,24 +16,41 @@ import io
 import os
 import wave
 import time
+import struct
+import hashlib
 import logging
 import subprocess
 import threading
 from pathlib import Path
 from queue import Queue, Empty
+from collections import OrderedDict
 from typing import Optional, Callable
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-# Try to import audio libraries
-try:
-    import numpy as np
-    import sounddevice as sd
-    SOUNDDEVICE_AVAILABLE = True
-except ImportError:
-    SOUNDDEVICE_AVAILABLE = False
-    logger.warning("sounddevice not available")
+# Audio libraries are imported lazily on first use: numpy+sounddevice
+# cost ~100-300ms of import time that non-voice CLI paths never need.
+# SOUNDDEVICE_AVAILABLE stays None until the first call resolves it.
+np = None
+sd = None
+SOUNDDEVICE_AVAILABLE: Optional[bool] = None
+
+
+def _ensure_sd() -> bool:
+    """Import numpy/sounddevice on first use and cache availability."""
+    global np, sd, SOUNDDEVICE_AVAILABLE
+    if SOUNDDEVICE_AVAILABLE is None:
+        try:
+            import numpy
+            import sounddevice
+            np = numpy
+            sd = sounddevice
+            SOUNDDEVICE_AVAILABLE = True
+        except ImportError:
+            SOUNDDEVICE_AVAILABLE = False
+            logger.warning("sounddevice not available")
+    return SOUNDDEVICE_AVAILABLE
 
 
 @dataclass
@@ -44,6 +61,147 @@ class PlaybackResult:
     error: Optional[str] = None
 
 
+def parse_wav_header(audio: bytes) -> tuple:
+    """
+    Parse a RIFF/WAV header directly from bytes.
+
+    Avoids BytesIO + the wave module so the PCM payload can be aliased
+    in place with np.frombuffer instead of copied out. Shared by the
+    playback and STT paths.
+
+    Returns:
+        (sample_rate, channels, sample_width, data_offset, data_length)
+
+    Raises:
+        ValueError: If the bytes are not a well-formed WAV stream
+    """
+    if len(audio) < 12:
+        raise ValueError("Truncated WAV header")
+
+    # Fast path: the canonical 44-byte mono PCM16 header that every
+    # capture/TTS WAV in this app uses - byte-compare the fixed fields
+    # and skip the chunk walk entirely
+    if (
+        len(audio) > 44
+        and audio[:4] == b'RIFF'
+        and audio[8:16] == b'WAVEfmt '
+        and audio[20:24] == b'\x01\x00\x01\x00'   # PCM, mono
+        and audio[34:36] == b'\x10\x00'           # 16-bit
+        and audio[36:40] == b'data'
+    ):
+        sample_rate = struct.unpack_from('<I', audio, 24)[0]
+        data_len = min(struct.unpack_from('<I', audio, 40)[0], len(audio) - 44)
+        return sample_rate, 1, 2, 44, data_len
+
+    riff, _, wave_id = struct.unpack_from('<4sI4s', audio, 0)
+    if riff != b'RIFF' or wave_id != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE stream")
+
+    sample_rate = channels = sample_width = None
+    offset = 12
+
+    while offset + 8 <= len(audio):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', audio, offset)
+        offset += 8
+
+        if chunk_id == b'fmt ':
+            _, channels, sample_rate, _, _, bits = struct.unpack_from(
+                '<HHIIHH', audio, offset
+            )
+            sample_width = bits // 8
+        elif chunk_id == b'data':
+            if sample_rate is None:
+                raise ValueError("WAV data chunk before fmt chunk")
+            chunk_size = min(chunk_size, len(audio) - offset)
+            return sample_rate, channels, sample_width, offset, chunk_size
+
+        # Chunks are word-aligned
+        offset += chunk_size + (chunk_size & 1)
+
+    raise ValueError("No WAV data chunk found")
+
+
+class _RingBuffer:
+    """
+    Fixed-capacity multi-producer/single-consumer ring buffer.
+
+    Replaces queue.Queue on the playback path: get bumps a plain int
+    and a threading.Event wakes the consumer; put takes one small
+    producer-side lock (uncontended in practice, and play() is public
+    so concurrent producers must be safe). Bounded, so a stalled output
+    device applies backpressure by dropping instead of growing without
+    limit.
+    """
+
+    __slots__ = (
+        '_buf', '_mask', '_head', '_tail', '_event',
+        '_drain_lock', '_put_lock',
+    )
+
+    def __init__(self, capacity: int = 64):
+        # Power-of-two capacity lets indices wrap with a mask
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self._buf = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0  # next slot to read (consumer only)
+        self._tail = 0  # next slot to write (producers, under _put_lock)
+        self._event = threading.Event()
+        # Serializes head movement between the consumer and clear()
+        self._drain_lock = threading.Lock()
+        # Serializes tail movement between producers: two concurrent
+        # play() calls must not claim the same slot
+        self._put_lock = threading.Lock()
+
+    def put(self, item) -> bool:
+        """Publish an item; returns False (drops) when full."""
+        with self._put_lock:
+            if self._tail - self._head > self._mask:
+                return False
+            self._buf[self._tail & self._mask] = item
+            self._tail += 1
+        self._event.set()
+        return True
+
+    def get(self, timeout: Optional[float] = None):
+        """Take the oldest item; raises Empty on timeout."""
+        if self._head == self._tail:
+            self._event.clear()
+            # Re-check: producer may have published between test and clear
+            if self._head == self._tail:
+                self._event.wait(timeout)
+                if self._head == self._tail:
+                    raise Empty
+        with self._drain_lock:
+            if self._head == self._tail:
+                # clear() drained the buffer between wait and lock
+                raise Empty
+            idx = self._head & self._mask
+            item = self._buf[idx]
+            self._buf[idx] = None
+            self._head += 1
+        return item
+
+    def empty(self) -> bool:
+        return self._head == self._tail
+
+    def qsize(self) -> int:
+        return self._tail - self._head
+
+    def clear(self) -> None:
+        """
+        Drop all queued items.
+
+        Safe from any thread: the drain lock keeps the head index
+        consistent against a concurrent consumer. empty()-then-get
+        loops cannot leave items behind the way queue.Queue can.
+        """
+        with self._drain_lock:
+            while self._head != self._tail:
+                self._buf[self._head & self._mask] = None
+                self._head += 1
+
+
 class AudioPlayer:
     """
     Audio playback manager with queue support.
@@ -74,10 +232,31 @@ class AudioPlayer:
         
         self._muted = False
         self._playing = False
-        self._queue: Queue = Queue()
+        self._queue = _RingBuffer()
         self._playback_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        
+
+        # Set whenever the queue is drained; wait() blocks on this
+        # instead of polling the queue
+        self._idle_event = threading.Event()
+        self._idle_event.set()
+
+        # Long-lived aplay processes keyed by (rate, channels, width)
+        self._aplay_procs: dict = {}
+
+        # LRU of parsed/converted clips: repeated confirmation sounds
+        # skip the WAV parse + dtype conversion on replays. Only clips
+        # up to _pcm_cache_clip_bytes are cached; bigger one-shot
+        # utterances convert into the reusable scratch buffer instead.
+        self._pcm_cache: OrderedDict = OrderedDict()
+        self._pcm_cache_cap = 32
+        self._pcm_cache_clip_bytes = 512 * 1024
+
+        # Grow-only float32 scratch for converting uncached clips -
+        # avoids a fresh allocation per clip on the playback thread.
+        # Safe to reuse because sd.wait() drains before the next decode.
+        self._pcm_scratch = None
+
         # Start playback thread if using queue
         if use_queue:
             self._start_playback_thread()
@@ -122,6 +301,7 @@ class AudioPlayer:
             return PlaybackResult(success=True, duration=0.0)
         
         if self.use_queue and not blocking:
+            self._idle_event.clear()
             self._queue.put(audio)
             return PlaybackResult(success=True)
         
@@ -148,41 +328,44 @@ class AudioPlayer:
     def stop(self) -> None:
         """Stop current playback and clear queue."""
         self._stop_event.set()
-        
-        # Clear queue
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except Empty:
-                break
-        
-        # Try to stop sounddevice
+
+        # Clear queue and release any wait()ers
+        self._queue.clear()
+        self._idle_event.set()
+
+        # Try to stop sounddevice (only if it was ever imported)
         if SOUNDDEVICE_AVAILABLE:
             try:
                 sd.stop()
             except Exception:
                 pass
-        
+
+        # Kill cached aplay processes (they respawn on next use)
+        self._close_aplay_procs()
+
         self._stop_event.clear()
         logger.debug("Playback stopped")
     
     def wait(self, timeout: Optional[float] = None) -> None:
         """Wait for all queued audio to play."""
         if self.use_queue and self._playback_thread:
-            # Put sentinel to signal completion check
-            start = time.time()
-            while not self._queue.empty():
-                if timeout and (time.time() - start) > timeout:
-                    break
-                time.sleep(0.1)
+            self._idle_event.wait(timeout=timeout)
     
     def shutdown(self) -> None:
         """Shutdown the player."""
         self._stop_event.set()
-        self._queue.put(None)  # Signal thread to exit
-        
+
+        # The exit sentinel must land even when the ring is full, or
+        # the worker never sees it and join() times out with the
+        # thread still running; nothing queued matters past shutdown
+        if not self._queue.put(None):
+            self._queue.clear()
+            self._queue.put(None)
+
         if self._playback_thread and self._playback_thread.is_alive():
             self._playback_thread.join(timeout=2.0)
+
+        self._close_aplay_procs()
     
     def _start_playback_thread(self) -> None:
         """Start the background playback thread."""
@@ -192,116 +375,299 @@ class AudioPlayer:
         )
         self._playback_thread.start()
     
+    # Upper bound on clips fused into one stream submission
+    _BATCH_MAX = 8
+
     def _playback_worker(self) -> None:
         """Background thread for queue-based playback."""
         while True:
             try:
                 audio = self._queue.get(timeout=0.5)
-                
+
                 if audio is None:
                     break
-                
-                if self._muted:
-                    continue
-                
-                self._play_audio(audio)
-                
+
+                # Opportunistically drain more queued clips so they can
+                # share one PortAudio stream open/close
+                batch = [audio]
+                saw_sentinel = False
+                while len(batch) < self._BATCH_MAX:
+                    try:
+                        nxt = self._queue.get(timeout=0)
+                    except Empty:
+                        break
+                    if nxt is None:
+                        saw_sentinel = True
+                        break
+                    batch.append(nxt)
+
+                if not self._muted:
+                    if len(batch) == 1:
+                        self._play_audio(audio)
+                    else:
+                        self._play_batch(batch)
+
+                if saw_sentinel:
+                    break
+
             except Empty:
+                self._idle_event.set()
                 continue
             except Exception as e:
                 logger.error(f"Playback worker error: {e}")
+            finally:
+                if self._queue.empty():
+                    self._idle_event.set()
+
+        self._idle_event.set()
+
+    def _play_batch(self, batch: list) -> None:
+        """
+        Play consecutive clips as one stream submission.
+
+        Each sd.play/sd.wait pair opens and closes a PortAudio stream
+        (several ms plus a potential xrun at the boundary); matching
+        clips are concatenated with a 10ms gap and submitted once.
+        Mixed layouts fall back to the per-clip path.
+        """
+        if not _ensure_sd():
+            for clip in batch:
+                self._play_audio(clip)
+            return
+
+        try:
+            decoded = [self._decode_for_playback(clip) for clip in batch]
+            first = decoded[0][0]
+            sample_rate = decoded[0][1]
+            if any(
+                sr != sample_rate or arr.dtype != first.dtype
+                or arr.shape[1:] != first.shape[1:]
+                for arr, sr, _ in decoded[1:]
+            ):
+                raise ValueError("mixed clip layouts")
+
+            gap_shape = (int(0.01 * sample_rate),) + first.shape[1:]
+            gap = np.zeros(gap_shape, dtype=first.dtype)
+            parts = []
+            for arr, _, _ in decoded:
+                parts.append(arr)
+                parts.append(gap)
+
+            self._playing = True
+            sd.play(np.concatenate(parts[:-1]), sample_rate, device=self.device_index)
+            sd.wait()
+            self._playing = False
+
+        except Exception as e:
+            self._playing = False
+            logger.debug(f"Batched playback fell back to per-clip: {e}")
+            for clip in batch:
+                self._play_audio(clip)
     
     def _play_audio(self, audio: bytes) -> PlaybackResult:
         """Play audio bytes."""
-        if SOUNDDEVICE_AVAILABLE:
+        if _ensure_sd():
             return self._play_sounddevice(audio)
         else:
             return self._play_aplay(audio)
     
+    _parse_wav_header = staticmethod(parse_wav_header)
+
+    def _scratch(self, need: int):
+        """Return a float32 scratch view of at least `need` samples."""
+        buf = self._pcm_scratch
+        if buf is None or buf.size < need:
+            grown = int((buf.size if buf is not None else 0) * 1.5)
+            self._pcm_scratch = buf = np.empty(max(need, grown), dtype=np.float32)
+        return buf[:need]
+
+    def _decode_for_playback(self, audio: bytes, reuse_scratch: bool = False) -> tuple:
+        """
+        Parse WAV bytes into an array sounddevice can play.
+
+        With reuse_scratch the converted samples land in the player's
+        scratch buffer; the result is only valid until the next decode,
+        so it must not be cached.
+
+        Returns:
+            (audio_data, sample_rate, duration)
+        """
+        # Parse WAV header in place - no BytesIO, no frame copy
+        sample_rate, channels, sample_width, data_off, data_len = (
+            self._parse_wav_header(audio)
+        )
+
+        dtypes = {1: np.uint8, 2: np.int16, 4: np.int32}
+        dtype = dtypes.get(sample_width)
+        if dtype is None:
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+
+        # Alias the PCM payload directly from the WAV bytes
+        audio_data = np.frombuffer(
+            audio, dtype=dtype, count=data_len // sample_width, offset=data_off
+        )
+
+        # Frame-shaped view first (no copy); PortAudio consumes
+        # interleaved (frames, channels) buffers, so conversion below
+        # writes straight into that layout in one pass
+        if channels > 1:
+            audio_data = audio_data.reshape(-1, channels)
+
+        if self.volume != 1.0:
+            # Scaling needs a float copy; PortAudio has no volume hook.
+            # Fold dtype conversion, normalization, and volume into one
+            # multiply with a precomputed scale - a single memory pass
+            # instead of astype + divide + multiply temporaries.
+            scale = np.float32(self.volume / {2: 32767.0, 4: 2147483647.0, 1: 128.0}[sample_width])
+            if reuse_scratch:
+                out = self._scratch(audio_data.size).reshape(audio_data.shape)
+            else:
+                out = np.empty(audio_data.shape, dtype=np.float32)
+            np.multiply(audio_data, scale, out=out)
+            if sample_width == 1:
+                # uint8 is offset-binary: (x/128 - 1) * vol = x*scale - vol
+                np.subtract(out, np.float32(self.volume), out=out)
+            audio_data = out
+
+        duration = data_len / (sample_rate * channels * sample_width)
+        return audio_data, sample_rate, duration
+
     def _play_sounddevice(self, audio: bytes) -> PlaybackResult:
         """Play using sounddevice."""
         try:
-            # Parse WAV
-            wav_io = io.BytesIO(audio)
-            with wave.open(wav_io, 'rb') as wav:
-                sample_rate = wav.getframerate()
-                channels = wav.getnchannels()
-                sample_width = wav.getsampwidth()
-                frames = wav.readframes(wav.getnframes())
-            
-            # Convert to numpy
-            if sample_width == 2:
-                audio_data = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32767
-            elif sample_width == 4:
-                audio_data = np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483647
+            # Fingerprint over the full clip: cacheable clips are capped
+            # at _pcm_cache_clip_bytes, so blake2b costs tens of
+            # microseconds - a prefix hash would let same-length clips
+            # with quiet onsets collide and replay the wrong audio.
+            # Volume is part of the key since it is baked into the
+            # converted samples.
+            if len(audio) > self._pcm_cache_clip_bytes:
+                # One-shot utterance: convert in the reusable scratch
+                audio_data, sample_rate, duration = self._decode_for_playback(
+                    audio, reuse_scratch=True
+                )
             else:
-                audio_data = np.frombuffer(frames, dtype=np.uint8).astype(np.float32) / 128 - 1.0
-            
-            # Apply volume
-            audio_data = audio_data * self.volume
-            
-            # Reshape for channels
-            if channels > 1:
-                audio_data = audio_data.reshape(-1, channels)
-            
-            duration = len(frames) / (sample_rate * channels * sample_width)
-            
+                cache_key = (
+                    self.volume,
+                    hashlib.blake2b(audio, digest_size=16).digest(),
+                )
+                cached = self._pcm_cache.get(cache_key)
+                if cached is not None:
+                    self._pcm_cache.move_to_end(cache_key)
+                    audio_data, sample_rate, duration = cached
+                else:
+                    audio_data, sample_rate, duration = self._decode_for_playback(audio)
+                    self._pcm_cache[cache_key] = (audio_data, sample_rate, duration)
+                    if len(self._pcm_cache) > self._pcm_cache_cap:
+                        self._pcm_cache.popitem(last=False)
+
             self._playing = True
+            # Integer PCM passes through untouched; PortAudio converts
             sd.play(audio_data, sample_rate, device=self.device_index)
             sd.wait()
             self._playing = False
-            
+
             return PlaybackResult(success=True, duration=duration)
-            
+
         except Exception as e:
             self._playing = False
             logger.error(f"sounddevice playback failed: {e}")
             return PlaybackResult(success=False, error=str(e))
     
+    # aplay raw format names by sample width
+    _APLAY_FORMATS = {1: "U8", 2: "S16_LE", 4: "S32_LE"}
+
+    def _get_aplay_proc(self, sample_rate: int, channels: int, sample_width: int):
+        """Get or spawn a long-lived aplay process for this PCM layout."""
+        key = (sample_rate, channels, sample_width)
+        proc = self._aplay_procs.get(key)
+
+        if proc is not None and proc.poll() is None:
+            return proc
+
+        cmd = [
+            "aplay", "-q", "-t", "raw",
+            "-f", self._APLAY_FORMATS[sample_width],
+            "-r", str(sample_rate),
+            "-c", str(channels),
+        ]
+
+        # Check for ALSA device setting
+        alsa_device = os.environ.get("PANDA_ALSA_DEVICE")
+        if alsa_device:
+            cmd.extend(["-D", alsa_device])
+
+        cmd.append("-")
+
+        # stderr must not be a pipe: nothing reads it on this long-lived
+        # process, so accumulated ALSA warnings would eventually fill
+        # the pipe buffer and block aplay mid-playback
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._aplay_procs[key] = proc
+        return proc
+
+    def _close_aplay_procs(self) -> None:
+        """Tear down any cached aplay processes."""
+        for proc in self._aplay_procs.values():
+            try:
+                if proc.stdin:
+                    proc.stdin.close()
+                proc.terminate()
+            except Exception:
+                pass
+        self._aplay_procs.clear()
+
     def _play_aplay(self, audio: bytes) -> PlaybackResult:
-        """Play using aplay (Linux fallback)."""
+        """
+        Play by streaming raw PCM into a cached aplay process.
+
+        Avoids the temp-WAV disk round-trip and the ~10-50ms fork/exec
+        of spawning aplay per clip; one process per PCM layout persists
+        and consecutive clips stream through its stdin in order.
+        """
         try:
-            # Save to temp file
-            temp_path = Path.home() / ".panda1" / "cache" / "temp_playback.wav"
-            temp_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(temp_path, 'wb') as f:
-                f.write(audio)
-            
-            # Get duration from WAV
-            wav_io = io.BytesIO(audio)
-            with wave.open(wav_io, 'rb') as wav:
-                duration = wav.getnframes() / wav.getframerate()
-            
-            # Build aplay command
-            cmd = ["aplay"]
-            
-            # Check for ALSA device setting
-            alsa_device = os.environ.get("PANDA_ALSA_DEVICE")
-            if alsa_device:
-                cmd.extend(["-D", alsa_device])
-            
-            cmd.append(str(temp_path))
-            
-            self._playing = True
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=duration + 5
+            sample_rate, channels, sample_width, data_off, data_len = (
+                self._parse_wav_header(audio)
             )
-            self._playing = False
-            
-            if result.returncode != 0:
+
+            if sample_width not in self._APLAY_FORMATS:
                 return PlaybackResult(
                     success=False,
-                    error=result.stderr.decode()
+                    error=f"Unsupported sample width: {sample_width}"
                 )
-            
-            return PlaybackResult(success=True, duration=duration)
-            
-        except subprocess.TimeoutExpired:
+
+            duration = data_len / (sample_rate * channels * sample_width)
+            pcm = memoryview(audio)[data_off:data_off + data_len]
+
+            self._playing = True
+            write_start = time.monotonic()
+            try:
+                proc = self._get_aplay_proc(sample_rate, channels, sample_width)
+                proc.stdin.write(pcm)
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError):
+                # Process died (e.g. device change) - respawn once
+                self._aplay_procs.pop((sample_rate, channels, sample_width), None)
+                proc = self._get_aplay_proc(sample_rate, channels, sample_width)
+                proc.stdin.write(pcm)
+                proc.stdin.flush()
+
+            # Hold until playback drains so callers keep the old
+            # blocking semantics. For clips larger than the OS pipe
+            # buffer the blocking write above already waited for most
+            # of the clip, so sleep only the remainder
+            elapsed = time.monotonic() - write_start
+            if elapsed < duration:
+                time.sleep(duration - elapsed)
             self._playing = False
-            return PlaybackResult(success=False, error="Playback timeout")
+
+            return PlaybackResult(success=True, duration=duration)
+
         except FileNotFoundError:
             self._playing = False
             return PlaybackResult(success=False, error="aplay not found")
@@ -378,20 +744,28 @@ def play_test_tone(
     Returns:
         PlaybackResult
     """
-    if not SOUNDDEVICE_AVAILABLE:
+    if not _ensure_sd():
         return PlaybackResult(success=False, error="sounddevice not available")
-    
+
     try:
         sample_rate = 44100
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        tone = 0.3 * np.sin(2 * np.pi * frequency * t)
-        
-        # Fade in/out
+        num_samples = int(sample_rate * duration)
         fade_samples = int(0.02 * sample_rate)
-        tone[:fade_samples] *= np.linspace(0, 1, fade_samples)
-        tone[-fade_samples:] *= np.linspace(1, 0, fade_samples)
-        
-        sd.play(tone.astype('float32'), sample_rate, device=device_index)
+
+        # Generate float32 end-to-end, mutating one buffer in place -
+        # the old linspace/sin/astype chain materialized four float64
+        # temporaries before the final float32 cast
+        tone = np.arange(num_samples, dtype=np.float32)
+        tone *= np.float32(2 * np.pi * frequency / sample_rate)
+        np.sin(tone, out=tone)
+        tone *= np.float32(0.3)
+
+        # Fade in/out (in-place on the edge slices)
+        fade = np.linspace(0, 1, fade_samples, dtype=np.float32)
+        tone[:fade_samples] *= fade
+        tone[-fade_samples:] *= fade[::-1]
+
+        sd.play(tone, sample_rate, device=device_index)
         sd.wait()
         
         return PlaybackResult(success=True, duration=duration)
@@ -412,8 +786,8 @@ def test_playback(device_index: Optional[int] = None) -> None:
     logging.info(f"{'='*60}")
     
     logging.info(f"\n  Device: {device_index or 'default'}")
-    logging.info(f"  sounddevice available: {SOUNDDEVICE_AVAILABLE}")
-    
+    logging.info(f"  sounddevice available: {_ensure_sd()}")
+
     if not SOUNDDEVICE_AVAILABLE:
         logging.info("\n  ❌ sounddevice not available!")
         logging.info("  Run: pip install sounddevice")
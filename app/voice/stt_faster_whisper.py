@@ -15,23 +15,35 @@ Features:
 import io
 import time
 import logging
+import importlib.util
 from pathlib import Path
-from typing import Optional, Literal, Tuple, List
+from typing import Optional, Literal, Tuple, List, Callable
 from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
-# Try to import faster-whisper
-try:
-    from faster_whisper import WhisperModel
-    FASTER_WHISPER_AVAILABLE = True
-except ImportError:
-    FASTER_WHISPER_AVAILABLE = False
-    WhisperModel = None
+from .playback import parse_wav_header
+
+# Availability is probed via find_spec (cheap metadata lookup); the
+# actual numpy/faster_whisper imports are deferred to first use so CLI
+# paths that never transcribe skip their import cost entirely
+np = None
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+if not FASTER_WHISPER_AVAILABLE:
     logger.warning("faster-whisper not available, STT disabled")
 
 
+def _ensure_np():
+    """Import numpy on first use."""
+    global np
+    if np is None and NUMPY_AVAILABLE:
+        import numpy
+        np = numpy
+    return np
+
+
 class STTLanguage(str, Enum):
     """Supported STT languages."""
     AUTO = "auto"
@@ -82,23 +94,28 @@ class FasterWhisperSTT:
         device: str = "auto",
         compute_type: str = "int8",
         cache_dir: Optional[Path] = None,
+        warm: bool = True,
     ):
         """
         Initialize Faster-Whisper STT.
-        
+
         Args:
             model_size: Model size (tiny, base, small, medium, large-v3)
             device: Device to use (auto, cuda, cpu)
             compute_type: Compute type (int8, float16, float32)
             cache_dir: Model cache directory
+            warm: Run a dummy inference after load so the first real
+                utterance does not pay kernel/graph warmup costs
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.cache_dir = cache_dir or Path.home() / ".panda1" / "cache" / "whisper"
+        self.warm = warm
         
-        self._model: Optional[WhisperModel] = None
+        self._model = None  # faster_whisper.WhisperModel once loaded
         self._model_loaded = False
+        self._resolved_device: Optional[str] = None
     
     @property
     def is_available(self) -> bool:
@@ -128,16 +145,20 @@ class FasterWhisperSTT:
         try:
             logger.info(f"Loading Faster-Whisper model: {self.model_size}")
             start_time = time.time()
-            
-            # Determine device
+
+            from faster_whisper import WhisperModel
+
+            # Determine device; find_spec avoids paying the torch import
+            # on systems without it
             device = self.device
             if device == "auto":
-                try:
+                if importlib.util.find_spec("torch") is not None:
                     import torch
                     device = "cuda" if torch.cuda.is_available() else "cpu"
-                except ImportError:
+                else:
                     device = "cpu"
-            
+            self._resolved_device = device
+
             # Adjust compute type for CPU
             compute_type = self.compute_type
             if device == "cpu" and compute_type == "float16":
@@ -156,7 +177,22 @@ class FasterWhisperSTT:
             
             load_time = time.time() - start_time
             logger.info(f"Model loaded in {load_time:.2f}s (device={device}, compute={compute_type})")
-            
+
+            # Warm inference: the first transcribe() otherwise pays 1-3s
+            # of CTranslate2 graph/kernel setup on the user's utterance
+            if self.warm and _ensure_np() is not None:
+                try:
+                    segments, _ = self._model.transcribe(
+                        np.zeros(1600, dtype=np.float32),
+                        language="en",
+                        beam_size=1,
+                        vad_filter=False,
+                    )
+                    for _ in segments:
+                        pass
+                except Exception as e:
+                    logger.debug(f"Model warmup inference failed: {e}")
+
             self._model_loaded = True
             return True
             
@@ -178,16 +214,21 @@ class FasterWhisperSTT:
         language: STTLanguage = STTLanguage.AUTO,
         beam_size: int = 5,
         vad_filter: bool = True,
+        on_segment: Optional[Callable[[dict], None]] = None,
     ) -> STTResult:
         """
         Transcribe audio to text.
-        
+
         Args:
-            audio: WAV audio bytes
+            audio: WAV audio bytes, or a mono float32 16kHz ndarray
+                (the CaptureResult.samples layout)
             language: Language mode (auto, en, ko)
             beam_size: Beam size for decoding
             vad_filter: Use VAD filtering
-        
+            on_segment: Optional callback fired per segment as it decodes,
+                so callers can overlap downstream work (UI, TTS) with the
+                rest of the decode instead of waiting for the full result
+
         Returns:
             STTResult with transcription
         """
@@ -201,15 +242,22 @@ class FasterWhisperSTT:
         start_time = time.time()
         
         try:
-            # Prepare audio file-like object
-            audio_io = io.BytesIO(audio)
-            
+            # Prepare model input: raw arrays pass straight through; for
+            # canonical 16kHz PCM WAV bytes we decode in-process so
+            # faster-whisper skips its ffmpeg/soundfile round-trip
+            if isinstance(audio, (bytes, bytearray)):
+                audio_input = self._wav_to_whisper_input(audio)
+                if audio_input is None:
+                    audio_input = io.BytesIO(audio)
+            else:
+                audio_input = audio
+
             # Set language parameter
             lang_param = None if language == STTLanguage.AUTO else language.value
-            
+
             # Transcribe
             segments, info = self._model.transcribe(
-                audio_io,
+                audio_input,
                 language=lang_param,
                 beam_size=beam_size,
                 vad_filter=vad_filter,
@@ -222,21 +270,37 @@ class FasterWhisperSTT:
             # Collect segments
             segment_list = []
             text_parts = []
-            total_confidence = 0.0
-            
+            logprobs = []
+
+            # segments is a generator: each iteration decodes the next
+            # segment, so the callback fires as soon as it is available
             for segment in segments:
-                segment_list.append({
+                segment_dict = {
                     "start": segment.start,
                     "end": segment.end,
                     "text": segment.text.strip(),
                     "avg_logprob": segment.avg_logprob,
-                })
-                text_parts.append(segment.text.strip())
-                # Convert log probability to confidence
-                total_confidence += 2 ** segment.avg_logprob
-            
+                }
+                segment_list.append(segment_dict)
+                text_parts.append(segment_dict["text"])
+                logprobs.append(segment.avg_logprob)
+
+                if on_segment:
+                    try:
+                        on_segment(segment_dict)
+                    except Exception as e:
+                        logger.debug(f"Segment callback error: {e}")
+
             full_text = " ".join(text_parts).strip()
-            avg_confidence = total_confidence / len(segment_list) if segment_list else 0.0
+            # Convert log probabilities to confidences in one vector pass
+            if logprobs and _ensure_np() is not None:
+                avg_confidence = float(
+                    np.exp2(np.asarray(logprobs, dtype=np.float32)).mean()
+                )
+            elif logprobs:
+                avg_confidence = sum(2 ** lp for lp in logprobs) / len(logprobs)
+            else:
+                avg_confidence = 0.0
             
             processing_time = time.time() - start_time
             
@@ -263,6 +327,53 @@ class FasterWhisperSTT:
                 processing_time=time.time() - start_time,
             )
     
+    @staticmethod
+    def _wav_to_whisper_input(audio: bytes):
+        """
+        Decode PCM WAV bytes to the float32 mono array Whisper expects.
+
+        Non-16kHz rates are resampled with soxr (SIMD polyphase) when it
+        is installed. Returns None for layouts that still need the
+        generic decoder (non-16-bit widths, non-16kHz without soxr,
+        missing numpy).
+        """
+        if _ensure_np() is None:
+            return None
+
+        try:
+            sample_rate, channels, sample_width, data_off, data_len = (
+                parse_wav_header(audio)
+            )
+        except ValueError:
+            return None
+
+        if sample_width != 2:
+            return None
+
+        if sample_rate != 16000:
+            try:
+                import soxr
+            except ImportError:
+                return None
+
+        # Alias the PCM payload - no copy until the float conversion
+        pcm = np.frombuffer(
+            audio, dtype=np.int16, count=data_len // 2, offset=data_off
+        )
+
+        if channels > 1:
+            arr = pcm.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+        else:
+            arr = pcm.astype(np.float32)
+
+        arr *= np.float32(1.0 / 32768.0)
+
+        if sample_rate != 16000:
+            # 'QQ' (quickest) quality is ample for Whisper's mel front-end
+            arr = soxr.resample(arr, sample_rate, 16000, quality='QQ')
+
+        return arr
+
     def transcribe_file(
         self,
         file_path: Path,
@@ -8,11 +8,21 @@ Version: 2.0
 
 import json
 import logging
+import functools
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Optional, Literal
 from enum import Enum
 
+# orjson encodes/decodes several times faster than stdlib json;
+# fall back silently since the config is small either way
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,11 +56,11 @@ class STTModel(str, Enum):
     LARGE = "large-v3"
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceConfig:
     """
     Voice subsystem configuration.
-    
+
     Saved to ~/.panda1/voice_config.json
     """
     
@@ -66,6 +76,8 @@ class VoiceConfig:
     stt_compute_type: str = "int8"  # int8, float16, float32
     stt_beam_size: int = 5
     stt_vad_filter: bool = True
+    stt_vad_skip_duration: float = 8.0  # Skip Whisper VAD for PTT clips shorter than this
+    stt_vad_skip_rms: float = 0.01  # ...when capture RMS is above this level
     
     # TTS settings
     tts_enabled: bool = True
@@ -74,6 +86,7 @@ class VoiceConfig:
     tts_muted: bool = False
     tts_voice_en: str = "am_michael"  # English voice (Kokoro)
     tts_voice_ko: str = "am_michael"  # Korean fallback (Kokoro)
+    tts_dtype: str = "q8"  # q8, fp16, fp32 (fp16 auto-selected on CUDA)
     
     # PTT settings
     ptt_enabled: bool = True
@@ -81,6 +94,8 @@ class VoiceConfig:
     ptt_min_duration: float = 0.3  # Minimum recording duration (seconds)
     ptt_max_duration: float = 30.0  # Maximum recording duration (seconds)
     ptt_silence_threshold: float = 0.01  # RMS threshold for silence detection
+    ptt_min_transcribe_sec: float = 0.3  # Skip transcription for shorter captures
+    ptt_noise_floor: float = 0.005  # Skip transcription below this RMS (silence)
     
     # Audio settings
     sample_rate: int = 16000  # 16kHz for Whisper
@@ -89,7 +104,17 @@ class VoiceConfig:
     # Paths (set by get_voice_config)
     config_path: Optional[str] = None
     cache_dir: Optional[str] = None
-    
+
+    # Memoized to_dict() payload; any field assignment clears it
+    _cached_dict: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_cached_dict":
+            object.__setattr__(self, "_cached_dict", None)
+
     def save(self) -> bool:
         """Save configuration to file."""
         if not self.config_path:
@@ -103,17 +128,26 @@ class VoiceConfig:
             self.tts_voice_en = _normalize_tts_voice(self.tts_voice_en)
             self.tts_voice_ko = _normalize_tts_voice(self.tts_voice_ko)
 
-            # Convert to dict, excluding paths
-            data = asdict(self)
-            data.pop("config_path", None)
-            data.pop("cache_dir", None)
-            
+            # Shallow field walk, excluding paths; asdict would
+            # deep-copy every value through its recursive machinery
+            data = {
+                f.name: getattr(self, f.name)
+                for f in fields(self)
+                if f.name not in ("config_path", "cache_dir")
+                and not f.name.startswith("_")
+            }
+
             # Convert enums to strings
             data["language_mode"] = self.language_mode.value
             data["stt_model"] = self.stt_model.value
-            
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+
+            if orjson is not None:
+                path.write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(path, "w") as f:
+                    json.dump(data, f, indent=2)
             
             logger.info(f"Voice config saved to {path}")
             return True
@@ -130,9 +164,9 @@ class VoiceConfig:
         
         if path.exists():
             try:
-                with open(path) as f:
-                    data = json.load(f)
-                
+                raw = path.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
                 # Handle enums
                 if "language_mode" in data:
                     data["language_mode"] = LanguageMode(data["language_mode"])
@@ -155,8 +189,17 @@ class VoiceConfig:
         return config
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for API responses."""
-        return {
+        """
+        Convert to dictionary for API responses.
+
+        The result is memoized until the next field assignment (status
+        endpoints call this far more often than settings change), so
+        callers must treat it as read-only.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        self._cached_dict = {
             "input_device": self.input_device,
             "output_device": self.output_device,
             "language_mode": self.language_mode.value,
@@ -172,12 +215,29 @@ class VoiceConfig:
             "ptt_key": self.ptt_key,
             "sample_rate": self.sample_rate,
         }
+        return self._cached_dict
 
 
 # Global config instance
 _voice_config: Optional[VoiceConfig] = None
 
 
+@functools.lru_cache(maxsize=4)
+def _resolve_paths(panda_home: Path) -> tuple:
+    """
+    Resolve (config_path, cache_dir) under a home dir, once per process.
+
+    Also ensures the cache directory exists; the lru_cache means the
+    mkdir stat happens once per home dir rather than on every re-init
+    (reset_voice_config + get_voice_config cycles in tests).
+    """
+    config_path = panda_home / "voice_config.json"
+    cache_dir = panda_home / "cache" / "voice"
+    if not cache_dir.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    return config_path, cache_dir
+
+
 def get_voice_config(panda_home: Optional[Path] = None) -> VoiceConfig:
     """
     Get or create the global voice configuration.
@@ -193,17 +253,13 @@ def get_voice_config(panda_home: Optional[Path] = None) -> VoiceConfig:
     if _voice_config is None:
         if panda_home is None:
             panda_home = Path.home() / ".panda1"
-        
-        config_path = panda_home / "voice_config.json"
-        cache_dir = panda_home / "cache" / "voice"
-        
+
+        config_path, cache_dir = _resolve_paths(panda_home)
+
         _voice_config = VoiceConfig.load(config_path)
         _voice_config.config_path = str(config_path)
         _voice_config.cache_dir = str(cache_dir)
-        
-        # Ensure cache directory exists
-        cache_dir.mkdir(parents=True, exist_ok=True)
-    
+
     return _voice_config
 
 
@@ -26,15 +26,47 @@ v0.2.10 Changes:
 """
 
 import logging
+import re
 import time
 import threading
 import queue
+from collections import deque
 from enum import Enum, auto
 from typing import Optional, Callable, Any, List, Dict
 from dataclasses import dataclass
 
+from .config import get_config
+
 logger = logging.getLogger(__name__)
 
+# Hoisted once here rather than re-resolved inside the hot methods;
+# sys.modules lookups per _transcribe/_check_speech call add up
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+    logger.warning("numpy not available, voice assistant disabled")
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except ImportError:
+    sd = None
+    SOUNDDEVICE_AVAILABLE = False
+    logger.warning("sounddevice not available, voice assistant disabled")
+
+# Aho-Corasick matches any number of wake phrases in one pass; the
+# regex alternation backtracks per phrase, which starts to show once
+# users configure more than a handful of aliases
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 
 class VoiceState(Enum):
     """Voice assistant states."""
@@ -68,6 +100,12 @@ class VoiceAssistant:
     - GUI integration callbacks (v0.2.10)
     """
     
+    # Loaded Whisper models, keyed (model_size, device, compute_type).
+    # Class-level so a stop()/start() cycle - or a second assistant in
+    # the same process - reuses the already-loaded weights instead of
+    # paying the multi-second CTranslate2 load again.
+    _MODEL_CACHE: Dict[tuple, Any] = {}
+
     def __init__(
         self,
         wake_phrases: Optional[list] = None,
@@ -94,10 +132,26 @@ class VoiceAssistant:
             on_state_change: Callback when state changes
             on_transcript: Callback for live transcript updates
         """
-        from .config import get_config
         config = get_config()
-        
+
         self.wake_phrases = wake_phrases or config.wake_phrase_list
+        # Lowercase the phrases once and fold them into a single
+        # compiled alternation, so every transcription check is one
+        # C-level scan instead of a Python loop of substring tests
+        self._wake_phrases_lc = tuple(p.lower() for p in self.wake_phrases)
+        self._wake_re = (
+            re.compile("|".join(map(re.escape, self._wake_phrases_lc)))
+            if self._wake_phrases_lc else None
+        )
+        # With many aliases an Aho-Corasick automaton beats the regex
+        # alternation; below that the constant factors don't pay off
+        self._wake_automaton = None
+        if AHOCORASICK_AVAILABLE and len(self._wake_phrases_lc) > 3:
+            automaton = ahocorasick.Automaton()
+            for phrase in self._wake_phrases_lc:
+                automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            self._wake_automaton = automaton
         self.sleep_timeout = sleep_timeout or (config.sleep_timeout_minutes * 60)
         self.whisper_model_wake = whisper_model_wake or config.whisper_model_wake
         self.whisper_model_command = whisper_model_command or config.whisper_model_command
@@ -111,10 +165,12 @@ class VoiceAssistant:
         
         # State
         self._state = VoiceState.SLEEPING
-        self._last_activity = time.time()
+        self._last_activity = time.monotonic()
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._event_queue: queue.Queue = queue.Queue()
+        # SimpleQueue: no task-done bookkeeping or finished-condition
+        # locks, and put() is reentrant - nobody join()s this queue
+        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
         self._mic_available = False
         self._mic_info: Optional[Dict] = None
         self._sd = None
@@ -122,6 +178,7 @@ class VoiceAssistant:
         # Audio components (initialized lazily)
         self._whisper_model = None
         self._whisper_model_small = None  # For wake detection
+        self._compute_type: Optional[str] = None  # Chosen by _load_whisper
         self._vad = None
         self._audio_stream = None
         
@@ -129,6 +186,11 @@ class VoiceAssistant:
         self._sample_rate = 16000
         self._chunk_duration = 0.5  # seconds per chunk for VAD
         self._chunk_size = int(self._sample_rate * self._chunk_duration)
+
+        # Energy gate: utterances shorter or quieter than this skip
+        # Whisper entirely (ambient blips that slip past the VAD)
+        self._min_utterance_sec = getattr(config, "wake_min_duration_sec", 0.4)
+        self._min_utterance_rms = getattr(config, "wake_min_rms", 0.005)
         
         logger.info(f"Voice assistant initialized with wake phrases: {self.wake_phrases}")
         logger.info(f"Sleep timeout: {self.sleep_timeout} seconds")
@@ -178,36 +240,82 @@ class VoiceAssistant:
         
         try:
             from faster_whisper import WhisperModel
-            
-            # Determine compute type based on available hardware
-            import torch
-            if torch.cuda.is_available():
-                device = "cuda"
-                compute_type = "float16"
-            else:
-                device = "cpu"
-                compute_type = "int8"
-            
+
+            # Determine device based on available hardware. ctranslate2
+            # ships with faster-whisper and answers the CUDA question
+            # directly; importing torch just for is_available() pulls
+            # in hundreds of MB of unrelated library
+            import ctranslate2
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
             # Load model (faster-whisper uses single model for all sizes)
             model_size = self.whisper_model_command  # e.g., "base", "small"
             logger.info(f"Loading Faster-Whisper model: {model_size} on {device}")
-            
-            self._whisper_model = WhisperModel(
-                model_size,
-                device=device,
-                compute_type=compute_type
-            )
-            self._whisper_model_small = self._whisper_model  # Same model for wake detection
-            
+
+            self._whisper_model = self._load_whisper(WhisperModel, model_size, device)
+            if self._whisper_model is None:
+                return False
+
+            # Wake detection runs every utterance while SLEEPING - the
+            # always-on duty cycle - so give it its own small model
+            # (tiny is ~6x fewer params than small) instead of aliasing
+            # the command model
+            if self.whisper_model_wake != self.whisper_model_command:
+                logger.info(
+                    f"Loading wake-detection model: {self.whisper_model_wake}"
+                )
+                self._whisper_model_small = self._load_whisper(
+                    WhisperModel, self.whisper_model_wake, device
+                )
+            if self._whisper_model_small is None:
+                self._whisper_model_small = self._whisper_model
+
             logger.info("Faster-Whisper model loaded")
             return True
-            
+
         except ImportError:
             logger.error("faster-whisper not installed. Install: pip install faster-whisper")
             return False
         except Exception as e:
             logger.error(f"Failed to load Faster-Whisper: {e}")
             return False
+
+    def _load_whisper(self, WhisperModel, model_size: str, device: str):
+        """
+        Load a Whisper model, falling back through compute types.
+
+        "auto" lets CTranslate2 pick the fastest type the hardware
+        supports (int8_float16 on Ampere+, VNNI int8 on modern CPUs)
+        rather than hardcoding one per device; some builds reject a
+        type with ValueError, so walk an explicit fallback chain.
+        """
+        for compute_type in ("auto", "int8_float16", "float16", "int8", "float32"):
+            cached = self._MODEL_CACHE.get((model_size, device, compute_type))
+            if cached is not None:
+                self._compute_type = compute_type
+                logger.info(
+                    f"Reusing cached Faster-Whisper {model_size} "
+                    f"({device}, compute_type={compute_type})"
+                )
+                return cached
+            try:
+                model = WhisperModel(
+                    model_size,
+                    device=device,
+                    compute_type=compute_type,
+                )
+                self._MODEL_CACHE[(model_size, device, compute_type)] = model
+                self._compute_type = compute_type
+                logger.info(
+                    f"Faster-Whisper {model_size} loaded "
+                    f"({device}, compute_type={compute_type})"
+                )
+                return model
+            except ValueError as e:
+                logger.warning(f"compute_type {compute_type} rejected: {e}")
+
+        logger.error(f"No supported compute type for {model_size} on {device}")
+        return None
     
     def _init_vad(self) -> bool:
         """Initialize Voice Activity Detection."""
@@ -228,10 +336,14 @@ class VoiceAssistant:
     
     def _init_audio(self) -> bool:
         """Initialize audio input stream."""
+        if not SOUNDDEVICE_AVAILABLE:
+            logger.error("sounddevice not installed. Install: pip install sounddevice")
+            self._mic_available = False
+            return False
+
         try:
-            import sounddevice as sd
             self._sd = sd
-            
+
             # Get device info
             try:
                 if self.audio_input_device is not None:
@@ -263,10 +375,6 @@ class VoiceAssistant:
                 self._mic_info = None
                 return False
                 
-        except ImportError:
-            logger.error("sounddevice not installed. Install: pip install sounddevice")
-            self._mic_available = False
-            return False
         except Exception as e:
             logger.error(f"Failed to init audio: {e}")
             self._mic_available = False
@@ -279,44 +387,43 @@ class VoiceAssistant:
             return None
         
         try:
-            import numpy as np
-            import tempfile
-            import soundfile as sf
-            
-            # Ensure audio is float32 and normalized
+            # Ensure audio is float32 and normalized; a single fused
+            # multiply-with-cast instead of astype + divide temporaries
             if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32) / 32768.0
-            
-            # Faster-whisper needs a file path or array
-            # Write to temp file for reliability
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                temp_path = f.name
-                sf.write(temp_path, audio_data, 16000)
-            
-            try:
-                # Transcribe with faster-whisper
-                segments, info = model.transcribe(
-                    temp_path,
-                    language=None,  # Auto-detect for Korean+English
-                    vad_filter=True,
-                    beam_size=5,
+                audio_data = np.multiply(
+                    audio_data, np.float32(1.0 / 32768.0), dtype=np.float32
                 )
-                
-                # Collect all segment text
-                text_parts = []
-                for segment in segments:
-                    text_parts.append(segment.text)
-                
-                text = " ".join(text_parts).strip()
-            finally:
-                # Clean up temp file
-                import os
-                try:
-                    os.unlink(temp_path)
-                except Exception as e:
-                    logging.error(f'Exception caught: {e}')
-                    pass
-            
+
+            if use_small_model:
+                # Wake path: we only ask "does this contain a wake
+                # phrase", not "what exactly was said" - greedy decode
+                # with no timestamps or cross-segment conditioning is
+                # several times cheaper, the VAD filter is redundant
+                # (webrtcvad already gated the utterance), and biasing
+                # the decoder toward the phrases helps tiny hit them.
+                # Language stays auto-detected: wake aliases are
+                # configurable and may be Korean.
+                options = {
+                    "beam_size": 1,
+                    "best_of": 1,
+                    "without_timestamps": True,
+                    "condition_on_previous_text": False,
+                    "vad_filter": False,
+                    "initial_prompt": " ".join(self._wake_phrases_lc),
+                }
+            else:
+                options = {"beam_size": 5, "vad_filter": True}
+
+            # faster-whisper takes the array directly - no temp-file WAV
+            # round-trip (encode, disk write, decode, unlink) per call
+            segments, info = model.transcribe(
+                audio_data,
+                language=None,  # Auto-detect for Korean+English
+                **options,
+            )
+
+            text = " ".join(segment.text for segment in segments).strip()
+
             # Send live transcript callback
             if text and self.on_transcript:
                 try:
@@ -331,51 +438,52 @@ class VoiceAssistant:
             return None
     
     def _is_wake_phrase(self, text: str) -> bool:
-        """Check if text contains wake phrase."""
-        if not text:
+        """Check if text contains a wake phrase."""
+        if not text or self._wake_re is None:
             return False
-        
-        text_lower = text.lower().strip()
-        
-        for phrase in self.wake_phrases:
-            if phrase in text_lower:
-                return True
-        
-        return False
+        lowered = text.lower()
+        if self._wake_automaton is not None:
+            return next(self._wake_automaton.iter(lowered), None) is not None
+        return self._wake_re.search(lowered) is not None
     
     def _check_speech(self, audio_chunk) -> bool:
         """Check if audio chunk contains speech using VAD."""
         if self._vad is None:
             return True  # If no VAD, assume always speech
         
-        import numpy as np
-
         try:
-            
-            # Convert to 16-bit PCM if needed
-            if audio_chunk.dtype == np.float32:
-                audio_int16 = (audio_chunk * 32767).astype(np.int16)
-            else:
-                audio_int16 = audio_chunk
-            
+            # The capture stream is opened with dtype='int16', so
+            # chunks arrive VAD-ready; no float32 conversion pass
+            audio_int16 = audio_chunk
+
             # VAD expects 10, 20, or 30ms frames at 16kHz
             frame_length = int(self._sample_rate * 0.03)  # 30ms
-            
-            # Check multiple frames
+            frame_bytes = frame_length * 2
+            total_frames = len(audio_int16) // frame_length
+            if total_frames == 0:
+                return False
+
+            # Serialize the whole chunk once and hand the VAD zero-copy
+            # memoryview slices, instead of a fresh ndarray slice plus
+            # tobytes allocation per 30ms frame
+            mv = memoryview(audio_int16[:total_frames * frame_length].tobytes())
+
+            # Consider speech if >30% of frames contain speech; stop
+            # scanning the moment the verdict can no longer change -
+            # typically after ~5 of 16 frames on clearly-voiced or
+            # clearly-silent chunks
+            needed = 0.3 * total_frames
             speech_frames = 0
-            total_frames = 0
-            
-            for i in range(0, len(audio_int16) - frame_length, frame_length):
-                frame = audio_int16[i:i + frame_length].tobytes()
+            for i in range(total_frames):
+                frame = mv[i * frame_bytes:(i + 1) * frame_bytes]
                 if self._vad.is_speech(frame, self._sample_rate):
                     speech_frames += 1
-                total_frames += 1
-            
-            # Consider speech if >30% of frames contain speech
-            if total_frames > 0:
-                return (speech_frames / total_frames) > 0.3
-            
-            return False
+                    if speech_frames > needed:
+                        return True
+                elif speech_frames + (total_frames - i - 1) <= needed:
+                    return False
+
+            return speech_frames > needed
             
         except Exception as e:
             logger.warning(f"VAD check error: {e}")
@@ -384,7 +492,7 @@ class VoiceAssistant:
     def _check_sleep_timeout(self) -> bool:
         """Check if we should return to sleep."""
         if self._state == VoiceState.AWAKE_LISTENING:
-            if time.time() - self._last_activity > self.sleep_timeout:
+            if time.monotonic() - self._last_activity > self.sleep_timeout:
                 logger.info("Sleep timeout reached")
                 self.state = VoiceState.SLEEPING
                 self._event_queue.put(VoiceEvent(type='timeout'))
@@ -395,16 +503,22 @@ class VoiceAssistant:
         """Main listening loop."""
         
         logger.info("Voice assistant listening loop started")
-        import numpy as np
 
         try:
             # Recording parameters
             recording = False
-            audio_buffer = []
             buffer_duration = 0.0
             max_buffer_duration = 10.0  # Max 10 seconds
             silence_count = 0
             max_silence = 4  # Number of silent chunks before processing
+
+            # Utterance accumulator: one preallocated buffer with a
+            # write cursor, so finishing an utterance hands _transcribe
+            # a view instead of np.concatenate copying up to 20 chunks
+            utterance = np.empty(
+                int(self._sample_rate * max_buffer_duration), dtype=np.int16
+            )
+            utterance_len = 0
             
             # Build input stream kwargs
             stream_kwargs = {
@@ -418,20 +532,45 @@ class VoiceAssistant:
             if self.audio_input_device is not None:
                 stream_kwargs['device'] = self.audio_input_device
             
-            sd = self._sd
-            if sd is None:
+            if self._sd is None:
                 raise RuntimeError("sounddevice not available")
 
-            with sd.InputStream(**stream_kwargs) as stream:
-                
+            # Callback capture: PortAudio delivers chunks on its own
+            # thread into a bounded deque, so a slow _transcribe call
+            # no longer stalls the device and drops frames mid-read.
+            # If transcription falls behind, the deque sheds the oldest
+            # chunks (4s of headroom) instead of growing stale backlog.
+            capture_q: deque = deque(maxlen=8)
+            data_ready = threading.Event()
+
+            def _on_audio(indata, frames, time_info, status):
+                if status:
+                    logger.debug(f"Capture status: {status}")
+                # Copy: PortAudio reuses indata's buffer after return
+                capture_q.append(indata[:, 0].copy())
+                data_ready.set()
+
+            stream_kwargs['callback'] = _on_audio
+
+            with sd.InputStream(**stream_kwargs):
+
+                loop_count = 0
                 while self._running:
-                    # Check sleep timeout
-                    self._check_sleep_timeout()
-                    
-                    # Read audio chunk
-                    chunk, _ = stream.read(self._chunk_size)
-                    chunk = chunk.flatten()
-                    
+                    # Check sleep timeout every 4th chunk (~2s); plenty
+                    # of granularity against a minutes-scale timeout
+                    if loop_count % 4 == 0:
+                        self._check_sleep_timeout()
+                    loop_count += 1
+
+                    # Pull the next captured chunk at our own pace
+                    try:
+                        chunk = capture_q.popleft()
+                    except IndexError:
+                        data_ready.clear()
+                        if not capture_q:
+                            data_ready.wait(timeout=0.5)
+                        continue
+
                     # Check for speech
                     has_speech = self._check_speech(chunk)
                     
@@ -439,39 +578,59 @@ class VoiceAssistant:
                         silence_count = 0
                         if not recording:
                             recording = True
-                            audio_buffer = []
+                            utterance_len = 0
                             buffer_duration = 0.0
-                        
-                        audio_buffer.append(chunk)
+
+                        # Clamped write keeps an overlong utterance from
+                        # running off the end of the buffer
+                        end = min(utterance_len + len(chunk), utterance.size)
+                        utterance[utterance_len:end] = chunk[:end - utterance_len]
+                        utterance_len = end
                         buffer_duration += self._chunk_duration
-                        
+
                     elif recording:
                         silence_count += 1
-                        audio_buffer.append(chunk)
+                        end = min(utterance_len + len(chunk), utterance.size)
+                        utterance[utterance_len:end] = chunk[:end - utterance_len]
+                        utterance_len = end
                         buffer_duration += self._chunk_duration
-                        
+
                         # Stop after silence
                         if silence_count >= max_silence or buffer_duration >= max_buffer_duration:
                             # Transcribe
-                            if audio_buffer:
-                                full_audio = np.concatenate(audio_buffer)
-                                
-                                # Use small model for wake detection when sleeping
-                                use_small = (self._state == VoiceState.SLEEPING)
-                                text = self._transcribe(full_audio, use_small_model=use_small)
-                                
-                                if text:
-                                    self._handle_transcription(text)
-                            
+                            if utterance_len:
+                                full_audio = utterance[:utterance_len]
+
+                                # Skip the Whisper encoder - the most
+                                # expensive op here - for clips that are
+                                # too short or too quiet to be speech
+                                rms = float(
+                                    np.sqrt(np.mean(np.square(full_audio, dtype=np.float32)))
+                                ) / 32768.0
+
+                                if (buffer_duration < self._min_utterance_sec
+                                        or rms < self._min_utterance_rms):
+                                    logger.debug(
+                                        f"Skipping transcription "
+                                        f"(dur={buffer_duration:.2f}s, rms={rms:.4f})"
+                                    )
+                                else:
+                                    # Use small model for wake detection when sleeping
+                                    use_small = (self._state == VoiceState.SLEEPING)
+                                    text = self._transcribe(full_audio, use_small_model=use_small)
+
+                                    if text:
+                                        self._handle_transcription(text)
+
                             # Reset
-                            audio_buffer = []
+                            utterance_len = 0
                             buffer_duration = 0.0
                             recording = False
                             silence_count = 0
-                    
-                    # Small delay to reduce CPU
-                    time.sleep(0.01)
-                    
+
+                    # No sleep here: chunks arrive at real-time rate,
+                    # so the empty-queue wait above paces the loop
+
         except Exception as e:
             logger.error(f"Listening loop error: {e}")
             self._event_queue.put(VoiceEvent(type='error', data=str(e)))
@@ -487,7 +646,7 @@ class VoiceAssistant:
             if self._is_wake_phrase(text):
                 logger.info(f"Wake phrase detected: {text}")
                 self.state = VoiceState.AWAKE_LISTENING
-                self._last_activity = time.time()
+                self._last_activity = time.monotonic()
                 self._event_queue.put(VoiceEvent(type='wake', transcript=text))
                 
                 if self.on_wake:
@@ -499,12 +658,12 @@ class VoiceAssistant:
         elif self._state == VoiceState.AWAKE_LISTENING:
             # Check for another wake phrase (ignore)
             if self._is_wake_phrase(text):
-                self._last_activity = time.time()
+                self._last_activity = time.monotonic()
                 return
             
             # This is a command
             if text.strip():
-                self._last_activity = time.time()
+                self._last_activity = time.monotonic()
                 self.state = VoiceState.PROCESSING
                 self._event_queue.put(VoiceEvent(type='command', transcript=text))
                 
@@ -516,7 +675,7 @@ class VoiceAssistant:
                 
                 # Return to listening
                 self.state = VoiceState.AWAKE_LISTENING
-                self._last_activity = time.time()
+                self._last_activity = time.monotonic()
     
     def start(self) -> bool:
         """
@@ -580,7 +739,7 @@ class VoiceAssistant:
         """Manually wake the assistant."""
         if self._state == VoiceState.SLEEPING:
             self.state = VoiceState.AWAKE_LISTENING
-            self._last_activity = time.time()
+            self._last_activity = time.monotonic()
             self._event_queue.put(VoiceEvent(type='wake', data='manual'))
             logger.info("Manually woken")
     
@@ -601,8 +760,12 @@ class VoiceAssistant:
             "audio_input_device": self.audio_input_device,
             "whisper_model_wake": self.whisper_model_wake,
             "whisper_model_command": self.whisper_model_command,
+            "compute_type": self._compute_type,
             "sleep_timeout": self.sleep_timeout,
-            "last_activity": self._last_activity,
+            # _last_activity is a monotonic instant (immune to wall
+            # clock steps); expose it as an age, which is what status
+            # readers actually want
+            "idle_seconds": round(time.monotonic() - self._last_activity, 1),
         }
 
 
@@ -622,9 +785,13 @@ def list_audio_devices() -> Dict[str, Any]:
         "error": None
     }
     
+    if not SOUNDDEVICE_AVAILABLE:
+        result["error"] = "sounddevice not installed. Install: pip install sounddevice"
+        return result
+
     try:
         result["sounddevice_available"] = True
-        
+
         devices = sd.query_devices()
         
         for i, dev in enumerate(devices):
@@ -661,12 +828,10 @@ def list_audio_devices() -> Dict[str, Any]:
             }
         except Exception:
             pass
-            
-    except ImportError:
-        result["error"] = "sounddevice not installed. Install: pip install sounddevice"
+
     except Exception as e:
         result["error"] = str(e)
-    
+
     return result
 
 
@@ -755,9 +920,14 @@ def mic_test(duration: float = 3.0, save_wav: bool = True) -> Dict[str, Any]:
         "wav_path": None,
         "error": None
     }
-    
+
+    if not SOUNDDEVICE_AVAILABLE or not NUMPY_AVAILABLE:
+        result["error"] = "sounddevice not installed"
+        logging.error("Error: sounddevice not installed")
+        logging.info("Install: pip install sounddevice")
+        return result
+
     try:
-        
         config = get_config()
         
         device_index = config.audio_input_device
@@ -812,46 +982,48 @@ def mic_test(duration: float = 3.0, save_wav: bool = True) -> Dict[str, Any]:
         
         # Save WAV if requested
         if save_wav:
-            import struct
-            
             wav_dir = config.audio_in_test_dir
             wav_dir.mkdir(parents=True, exist_ok=True)
-            
+
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             wav_path = wav_dir / f"mic_test_{timestamp}.wav"
-            
-            # Convert to int16
-            audio_int16 = (audio * 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
-            
-            with open(wav_path, 'wb') as f:
-                # WAV header
-                f.write(b'RIFF')
-                f.write(struct.pack('<I', 36 + len(audio_bytes)))
-                f.write(b'WAVE')
-                f.write(b'fmt ')
-                f.write(struct.pack('<I', 16))  # Subchunk1Size
-                f.write(struct.pack('<H', 1))   # AudioFormat (PCM)
-                f.write(struct.pack('<H', 1))   # NumChannels
-                f.write(struct.pack('<I', sample_rate))
-                f.write(struct.pack('<I', sample_rate * 2))  # ByteRate
-                f.write(struct.pack('<H', 2))   # BlockAlign
-                f.write(struct.pack('<H', 16))  # BitsPerSample
-                f.write(b'data')
-                f.write(struct.pack('<I', len(audio_bytes)))
-                f.write(audio_bytes)
-            
+
+            try:
+                # soundfile (libsndfile) handles the float->PCM_16
+                # conversion and header in C, in one buffered write
+                import soundfile as sf
+                sf.write(str(wav_path), audio, sample_rate, subtype='PCM_16')
+            except ImportError:
+                import struct
+
+                # Clip before the cast: astype wraps out-of-range
+                # values around, turning loud peaks into full-scale
+                # inverted clicks; saturating matches what libsndfile
+                # does on the soundfile path
+                audio_int16 = np.clip(
+                    audio * 32767.0, -32768, 32767
+                ).astype(np.int16)
+                audio_bytes = audio_int16.tobytes()
+
+                # Pack the 44-byte header in one call and write header
+                # plus payload together, instead of 13 tiny f.write()s
+                header = struct.pack(
+                    '<4sI4s4sIHHIIHH4sI',
+                    b'RIFF', 36 + len(audio_bytes), b'WAVE',
+                    b'fmt ', 16, 1, 1,
+                    sample_rate, sample_rate * 2, 2, 16,
+                    b'data', len(audio_bytes),
+                )
+                with open(wav_path, 'wb') as f:
+                    f.write(header + audio_bytes)
+
             result["wav_path"] = str(wav_path)
             logging.info(f"Saved: {wav_path}")
         
-    except ImportError:
-        result["error"] = "sounddevice not installed"
-        logging.error("Error: sounddevice not installed")
-        logging.info("Install: pip install sounddevice")
     except Exception as e:
         result["error"] = str(e)
         logging.error(f"Error: {e}")
-    
+
     return result
 
 
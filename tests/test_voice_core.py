@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+PANDA.1 Voice Core Test Suite
+=============================
+
+Tests for the pure-logic voice plumbing: WAV header parsing, the
+playback ring buffer, streaming TTS chunking, language detection,
+voice config persistence, batch synthesis mapping, and debounced
+config saves. None of these need audio hardware.
+
+Run with: pytest tests/test_voice_core.py -v
+"""
+
+import io
+import struct
+import threading
+import time
+import wave
+from pathlib import Path
+from queue import Empty
+
+import pytest
+
+
+def make_wav(
+    pcm: bytes,
+    sample_rate: int = 16000,
+    channels: int = 1,
+    sample_width: int = 2,
+) -> bytes:
+    """Build canonical WAV bytes via the stdlib wave module."""
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as w:
+        w.setnchannels(channels)
+        w.setsampwidth(sample_width)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+# =============================================================================
+# parse_wav_header: canonical fast path, chunk walk, malformed input
+# =============================================================================
+class TestParseWavHeader:
+
+    def test_canonical_mono_pcm16(self):
+        from app.voice.playback import parse_wav_header
+
+        pcm = b'\x01\x00' * 100
+        rate, channels, width, off, length = parse_wav_header(make_wav(pcm))
+        assert (rate, channels, width) == (16000, 1, 2)
+        assert length == len(pcm)
+        assert off == 44
+
+    def test_extra_chunk_before_data(self):
+        """A LIST chunk between fmt and data must be walked over."""
+        from app.voice.playback import parse_wav_header
+
+        pcm = b'\xff\x7f' * 10
+        fmt = struct.pack('<HHIIHH', 1, 2, 44100, 44100 * 4, 4, 16)
+        info = b'INFOsoftware'
+        body = (
+            b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+            + b'LIST' + struct.pack('<I', len(info)) + info
+            + b'data' + struct.pack('<I', len(pcm)) + pcm
+        )
+        audio = b'RIFF' + struct.pack('<I', 4 + len(body)) + b'WAVE' + body
+
+        rate, channels, width, off, length = parse_wav_header(audio)
+        assert (rate, channels, width) == (44100, 2, 2)
+        assert audio[off:off + length] == pcm
+
+    def test_truncated_data_chunk_is_clamped(self):
+        """A data size field larger than the payload clamps, not overruns."""
+        from app.voice.playback import parse_wav_header
+
+        audio = make_wav(b'\x00\x00' * 50)
+        truncated = audio[:-20]
+        rate, channels, width, off, length = parse_wav_header(truncated)
+        assert off + length == len(truncated)
+
+    def test_rejects_non_riff(self):
+        from app.voice.playback import parse_wav_header
+
+        with pytest.raises(ValueError):
+            parse_wav_header(b'OggS' + b'\x00' * 60)
+
+    def test_rejects_data_before_fmt(self):
+        from app.voice.playback import parse_wav_header
+
+        body = b'data' + struct.pack('<I', 4) + b'\x00' * 4
+        audio = b'RIFF' + struct.pack('<I', 4 + len(body)) + b'WAVE' + body
+        with pytest.raises(ValueError):
+            parse_wav_header(audio)
+
+    def test_rejects_missing_data_chunk(self):
+        from app.voice.playback import parse_wav_header
+
+        fmt = struct.pack('<HHIIHH', 1, 1, 16000, 32000, 2, 16)
+        body = b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+        audio = b'RIFF' + struct.pack('<I', 4 + len(body)) + b'WAVE' + body
+        with pytest.raises(ValueError):
+            parse_wav_header(audio)
+
+
+# =============================================================================
+# _RingBuffer: FIFO, bounded drop, clear, multi-producer safety
+# =============================================================================
+class TestRingBuffer:
+
+    def test_fifo_order(self):
+        from app.voice.playback import _RingBuffer
+
+        ring = _RingBuffer(capacity=8)
+        for i in range(5):
+            assert ring.put(i)
+        assert [ring.get(timeout=0) for _ in range(5)] == [0, 1, 2, 3, 4]
+
+    def test_drops_when_full(self):
+        from app.voice.playback import _RingBuffer
+
+        ring = _RingBuffer(capacity=4)
+        for i in range(4):
+            assert ring.put(i)
+        assert ring.put(99) is False
+        assert ring.qsize() == 4
+
+    def test_get_timeout_raises_empty(self):
+        from app.voice.playback import _RingBuffer
+
+        ring = _RingBuffer(capacity=4)
+        with pytest.raises(Empty):
+            ring.get(timeout=0.01)
+
+    def test_clear_then_sentinel(self):
+        """shutdown()'s clear-and-retry must always land the sentinel."""
+        from app.voice.playback import _RingBuffer
+
+        ring = _RingBuffer(capacity=4)
+        for i in range(4):
+            ring.put(i)
+        assert ring.put(None) is False
+        ring.clear()
+        assert ring.put(None) is True
+        assert ring.get(timeout=0) is None
+
+    def test_rejects_non_power_of_two(self):
+        from app.voice.playback import _RingBuffer
+
+        with pytest.raises(ValueError):
+            _RingBuffer(capacity=6)
+
+    def test_concurrent_producers_lose_nothing(self):
+        from app.voice.playback import _RingBuffer
+
+        ring = _RingBuffer(capacity=1024)
+        per_producer, producers = 200, 4
+
+        def produce(p):
+            for i in range(per_producer):
+                assert ring.put((p, i))
+
+        threads = [
+            threading.Thread(target=produce, args=(p,))
+            for p in range(producers)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        got = []
+        while not ring.empty():
+            got.append(ring.get(timeout=0))
+        assert len(got) == per_producer * producers
+        assert len(set(got)) == len(got)
+
+
+# =============================================================================
+# _Channel: FIFO, timeout, bounded backpressure released by clear()
+# =============================================================================
+class TestChannel:
+
+    def test_fifo_and_timeout(self):
+        from app.panda_tts.streamer import _Channel
+
+        ch = _Channel()
+        ch.put("a")
+        ch.put("b")
+        assert ch.get(timeout=0) == "a"
+        assert ch.get(timeout=0) == "b"
+        with pytest.raises(Empty):
+            ch.get(timeout=0.01)
+
+    def test_bounded_put_blocks_until_clear(self):
+        from app.panda_tts.streamer import _Channel
+
+        ch = _Channel(maxsize=1)
+        ch.put("first")
+        unblocked = threading.Event()
+
+        def producer():
+            ch.put("second")  # blocks: channel is full
+            unblocked.set()
+
+        t = threading.Thread(target=producer, daemon=True)
+        t.start()
+        assert not unblocked.wait(timeout=0.1)
+
+        ch.clear()  # must wake the blocked producer
+        assert unblocked.wait(timeout=2.0)
+        t.join(timeout=2.0)
+
+
+# =============================================================================
+# TTSStreamer chunking: sentence cuts, scan-offset resume, text filter
+# =============================================================================
+class FakeTTSEngine:
+    """Minimal engine capturing what the streamer asks it to speak."""
+
+    def __init__(self):
+        self.texts = []
+
+    def synthesize_chunks(self, text, lang):
+        self.texts.append(text)
+        yield make_wav(b'\x00\x00' * 4, sample_rate=24000)
+
+
+class DummyPlayer:
+    def play(self, wav_bytes):
+        pass
+
+    def play_pcm(self, pcm, sample_rate):
+        pass
+
+    def stop(self):
+        pass
+
+
+def make_streamer(**kwargs):
+    from app.panda_tts.streamer import TTSStreamer
+
+    streamer = TTSStreamer(FakeTTSEngine(), lang="en", **kwargs)
+    streamer._player = DummyPlayer()
+    return streamer
+
+
+class TestStreamerChunking:
+
+    def extract(self, streamer, token, final=False):
+        """Feed one token through the chunker path, single-threaded."""
+        streamer._buffer_parts.append(token)
+        return [c.text for c in streamer._extract_chunks(final=final)]
+
+    def test_cuts_complete_sentences_only(self):
+        s = make_streamer()
+        assert self.extract(s, "Hello world. And then") == ["Hello world."]
+        # Remainder stays buffered until its terminator arrives
+        assert self.extract(s, " some more! tail") == ["And then some more!"]
+
+    def test_scan_offset_resumes_not_rescans(self):
+        """Terminators already passed over must not match on later scans."""
+        s = make_streamer()
+        # "3.14" contains a terminator followed by a non-space: no cut
+        assert self.extract(s, "pi is 3.14 and") == []
+        assert s._scan_offset > 0
+        # The next token completes the sentence; the earlier '.' stays inert
+        assert self.extract(s, " more. next") == ["pi is 3.14 and more."]
+
+    def test_final_flush_emits_remainder(self):
+        s = make_streamer()
+        assert self.extract(s, "no terminator here", final=True) == [
+            "no terminator here"
+        ]
+        assert s._scan_offset == 0
+        assert s._buffer_parts == []
+
+    def test_terminator_runs_stay_attached(self):
+        s = make_streamer()
+        assert self.extract(s, "Wait... what?! ok") == ["Wait...", "what?!"]
+
+    def test_text_filter_applied_per_sentence(self):
+        s = make_streamer(text_filter=lambda t: t.replace("BOS", "BOSS"))
+        assert self.extract(s, "Yes BOS. next") == ["Yes BOSS."]
+
+    def test_pipeline_end_to_end_preserves_content(self):
+        """Threaded run: content preserved, cuts only at terminators."""
+        text = "First one. Second, longer one! Third? Trailing tail"
+        s = make_streamer()
+        for i in range(0, len(text), 7):
+            s.feed(text[i:i + 7])
+        s.end()
+        s.wait(timeout=10.0)
+
+        spoken = s._engine.texts
+        assert " ".join(spoken).split() == text.split()
+        for chunk in spoken[:-1]:
+            assert chunk[-1] in ".!?。！？"
+
+
+# =============================================================================
+# detect_language: ASCII fast path, Hangul ratio, long-text table path
+# =============================================================================
+class TestDetectLanguage:
+
+    def test_ascii_is_english(self):
+        from app.panda_tts.base import detect_language
+
+        assert detect_language("Hello, how are you today?") == "en"
+        assert detect_language("") == "en"
+
+    def test_korean_text(self):
+        from app.panda_tts.base import detect_language
+
+        assert detect_language("안녕하세요 반갑습니다") == "ko"
+
+    def test_mostly_english_with_accents(self):
+        from app.panda_tts.base import detect_language
+
+        assert detect_language("Café au lait, s'il vous plaît") == "en"
+
+    def test_mixed_ratio_threshold(self):
+        from app.panda_tts.base import detect_language
+
+        # A couple of Hangul syllables in a long English sentence stay "en"
+        assert detect_language("The word 안녕 means hello in Korean text") == "en"
+
+    def test_long_text_table_path_matches_short_path(self):
+        """Above the table threshold the verdict must not change."""
+        from app.panda_tts.base import detect_language, _TABLE_MIN_CHARS
+
+        ko_short = "안녕하세요 오늘 날씨가 좋네요 "
+        en_short = "just some english words here "
+        ko_long = ko_short * (_TABLE_MIN_CHARS // len(ko_short) + 1)
+        en_long = (en_short + "é ") * (_TABLE_MIN_CHARS // len(en_short) + 1)
+
+        assert detect_language(ko_long) == detect_language(ko_short) == "ko"
+        assert detect_language(en_long) == "en"
+
+
+# =============================================================================
+# VoiceConfig: save/load round-trip, to_dict memo invalidation
+# =============================================================================
+class TestVoiceConfig:
+
+    def test_save_load_round_trip(self, tmp_path):
+        from app.voice.voice_config import VoiceConfig, LanguageMode, STTModel
+
+        path = tmp_path / "voice_config.json"
+        config = VoiceConfig()
+        config.config_path = str(path)
+        config.language_mode = LanguageMode.KOREAN
+        config.stt_model = STTModel.TINY
+        config.tts_speed = 1.5
+        config.tts_muted = True
+        assert config.save()
+
+        loaded = VoiceConfig.load(path)
+        assert loaded.language_mode == LanguageMode.KOREAN
+        assert loaded.stt_model == STTModel.TINY
+        assert loaded.tts_speed == 1.5
+        assert loaded.tts_muted is True
+
+    def test_load_missing_file_uses_defaults(self, tmp_path):
+        from app.voice.voice_config import VoiceConfig, LanguageMode
+
+        loaded = VoiceConfig.load(tmp_path / "does_not_exist.json")
+        assert loaded.language_mode == LanguageMode.AUTO
+        assert loaded.tts_enabled is True
+
+    def test_to_dict_memo_invalidated_by_assignment(self):
+        from app.voice.voice_config import VoiceConfig
+
+        config = VoiceConfig()
+        first = config.to_dict()
+        assert config.to_dict() is first  # memoized between assignments
+
+        config.tts_volume = 0.25
+        second = config.to_dict()
+        assert second is not first
+        assert second["tts_volume"] == 0.25
+
+    def test_to_dict_serializes_enums(self):
+        from app.voice.voice_config import VoiceConfig
+
+        data = VoiceConfig().to_dict()
+        assert isinstance(data["language_mode"], str)
+        assert isinstance(data["stt_model"], str)
+
+
+# =============================================================================
+# KokoroEngine.synthesize_batch: positional mapping and its guards
+# =============================================================================
+class FakeKPipeline:
+    """KPipeline stand-in yielding n chunks per newline-joined input."""
+
+    def __init__(self, chunks_per_input=1):
+        self.chunks_per_input = chunks_per_input
+
+    def __call__(self, text, voice=None, speed=None, split_pattern=None):
+        np = pytest.importorskip("numpy")
+        parts = text.split("\n") if split_pattern else [text]
+        for part in parts:
+            for _ in range(self.chunks_per_input):
+                yield part, part, np.zeros(8, dtype=np.float32)
+
+
+@pytest.fixture
+def batch_engine(tmp_path, monkeypatch):
+    import contextlib
+    from app.panda_tts.kokoro_engine import KokoroEngine
+
+    engine = KokoroEngine.__new__(KokoroEngine)
+    engine._is_warmed_up = True
+    engine._voice = "am_michael"
+    engine._speed = 1.0
+    engine._output_dir = tmp_path
+    engine._inference_ctx = contextlib.nullcontext
+    engine._pipeline = FakeKPipeline()
+    monkeypatch.setattr(
+        KokoroEngine, "_save_wav",
+        staticmethod(lambda audio, path: Path(path).write_bytes(b'wav')),
+    )
+    return engine
+
+
+class TestSynthesizeBatch:
+
+    def test_positional_mapping_skips_empty_inputs(self, batch_engine):
+        results = batch_engine.synthesize_batch(["Hello.", "", "World."], "en")
+        assert results[0] is not None
+        assert results[1] is None
+        assert results[2] is not None
+        assert results[0] != results[2]
+
+    def test_chunk_mismatch_falls_back_to_sequential(self, batch_engine):
+        batch_engine._pipeline = FakeKPipeline(chunks_per_input=2)
+        sequential = []
+        batch_engine.synthesize = (
+            lambda text, lang, output_path=None:
+                sequential.append(text) or Path("/tmp/seq.wav")
+        )
+        results = batch_engine.synthesize_batch(["One.", "Two."], "en")
+        assert sequential == ["One.", "Two."]
+        assert all(r is not None for r in results)
+
+    def test_overlong_input_falls_back_to_sequential(self, batch_engine):
+        from app.panda_tts.kokoro_engine import _BATCH_MAX_INPUT_CHARS
+
+        sequential = []
+        batch_engine.synthesize = (
+            lambda text, lang, output_path=None:
+                sequential.append(text) or Path("/tmp/seq.wav")
+        )
+        long_text = "x" * (_BATCH_MAX_INPUT_CHARS + 1)
+        results = batch_engine.synthesize_batch([long_text, "short."], "en")
+        assert sequential == [long_text, "short."]
+        assert all(r is not None for r in results)
+
+    def test_empty_batch(self, batch_engine):
+        assert batch_engine.synthesize_batch([], "en") == []
+        assert batch_engine.synthesize_batch(["", "  "], "en") == [None, None]
+
+
+# =============================================================================
+# VoiceManager debounced config save: coalescing and flush
+# =============================================================================
+class TestDebouncedSave:
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        from app.voice.manager import VoiceManager
+        from app.voice.voice_config import VoiceConfig
+
+        saves = []
+        monkeypatch.setattr(
+            VoiceConfig, "save", lambda self: saves.append(1) or True
+        )
+        vm = VoiceManager(config=VoiceConfig())
+        vm.SAVE_DEBOUNCE_SEC = 0.05
+        return vm, saves
+
+    def test_rapid_setters_coalesce_into_one_save(self, manager):
+        vm, saves = manager
+        for volume in (0.1, 0.2, 0.3, 0.4, 0.5):
+            vm.set_volume(volume)
+        assert saves == []  # nothing hits disk inside the idle window
+
+        deadline = time.monotonic() + 2.0
+        while not saves and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)  # no trailing extra saves
+        assert saves == [1]
+        assert vm.config.tts_volume == 0.5
+
+    def test_flush_config_saves_immediately(self, manager):
+        vm, saves = manager
+        vm.set_mute(True)
+        vm.flush_config()
+        assert saves == [1]
+        # A second flush with nothing pending must not save again
+        vm.flush_config()
+        assert saves == [1]